@@ -18,6 +18,7 @@ from .core.exceptions import (
     KMLParseError,
     KMLValidationError,
 )
+from .core.querysets import Q
 from .models.base import KMLElement
 from .models.folder import Folder
 from .models.multigeometry import MultiGeometry
@@ -44,4 +45,5 @@ __all__ = [
     "Coordinate",
     "MultiGeometry",
     "KMLFile",
+    "Q",
 ]
@@ -16,7 +16,7 @@ from .exceptions import (
     KMLValidationError,
 )
 from .managers import KMLManager, RelatedManager
-from .querysets import KMLQuerySet
+from .querysets import KMLQuerySet, Q
 
 __all__ = [
     "KMLOrmException",
@@ -29,4 +29,5 @@ __all__ = [
     "KMLManager",
     "RelatedManager",
     "KMLQuerySet",
+    "Q",
 ]
@@ -8,13 +8,23 @@ to Django's ORM managers.
 
 # pylint: disable=too-many-public-methods, too-many-lines
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, List, Optional, TypeVar, Generic, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypeVar, Generic, cast
 
 
 from .exceptions import KMLElementNotFound, KMLMultipleElementsReturned
-from .querysets import KMLQuerySet
+from .querysets import (
+    COORDINATE_ARRAYS_MIN_ELEMENTS,
+    HAS_NUMPY,
+    KMLQuerySet,
+    Q,
+    check_bounds,
+    near_center,
+)
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from ..models.base import KMLElement
     from ..models.folder import Folder
     from ..models.placemark import Placemark  # noqa: F401
@@ -45,6 +55,9 @@ class KMLManager(Generic[T]):
         self._folders_manager = folders_manager
         # Set by KMLFile for geometry managers to access root placemarks
         self._placemarks_manager: Optional["KMLManager[Any]"] = None
+        # QuerySet over the elements reused by spatial queries, so its coordinate
+        # index is only rebuilt when coordinates change
+        self._spatial_cache: Optional["KMLQuerySet[T]"] = None
 
     @property
     def elements(self) -> List[T]:
@@ -149,7 +162,7 @@ class KMLManager(Generic[T]):
 
         if attribute_name == "folders":
             # For folders, get all nested folders
-            for folder in parent_folders.children():
+            for folder in parent_folders.elements:
                 elements.append(cast(T, folder))
                 # Recursively get nested folders
                 subfolder_manager = getattr(folder, "folders", None)
@@ -157,11 +170,11 @@ class KMLManager(Generic[T]):
                     elements.extend(subfolder_manager.all())
         else:
             # For other element types, collect from all nested folders
-            for folder in parent_folders.children():
+            for folder in parent_folders.elements:
                 # Get elements from this folder
                 folder_manager = getattr(folder, attribute_name, None)
                 if folder_manager:
-                    elements.extend(list(folder_manager.children()))
+                    elements.extend(folder_manager.elements)
                 # Recursively collect from nested folders
                 subfolder_manager = getattr(folder, "folders", None)
                 if subfolder_manager:
@@ -169,7 +182,7 @@ class KMLManager(Generic[T]):
                     for nested_folder in all_nested_folders:
                         nested_manager = getattr(nested_folder, attribute_name, None)
                         if nested_manager:
-                            elements.extend(list(nested_manager.children()))
+                            elements.extend(nested_manager.elements)
 
         return elements
 
@@ -242,7 +255,7 @@ class KMLManager(Generic[T]):
         if attribute_name == "folders":
             # For folders, use recursive .all() on the folders manager itself
             # This will properly collect all nested folders
-            for folder in self._folders_manager.children():
+            for folder in self._folders_manager.elements:
                 # Add the folder itself
                 elements.append(cast(T, folder))
                 # Recursively collect all nested folders
@@ -256,10 +269,10 @@ class KMLManager(Generic[T]):
             # 2. Recursively get elements from ALL nested folders
 
             # First, collect from direct child folders
-            for folder in self._folders_manager.children():
+            for folder in self._folders_manager.elements:
                 folder_manager = getattr(folder, attribute_name, None)
                 if folder_manager:
-                    elements.extend(list(folder_manager.children()))
+                    elements.extend(folder_manager.elements)
 
                 # Then recursively collect from all nested subfolders
                 subfolder_manager = getattr(folder, "folders", None)
@@ -269,7 +282,7 @@ class KMLManager(Generic[T]):
                     for nested_folder in all_nested_folders:
                         nested_manager = getattr(nested_folder, attribute_name, None)
                         if nested_manager:
-                            elements.extend(list(nested_manager.children()))
+                            elements.extend(nested_manager.elements)
 
         return elements
 
@@ -355,29 +368,31 @@ class KMLManager(Generic[T]):
 
         return type_mapping.get(self._model_class)
 
-    def filter(self, **kwargs: Any) -> "KMLQuerySet[T]":
+    def filter(self, *args: "Q", **kwargs: Any) -> "KMLQuerySet[T]":
         """
         Filter elements based on field lookups.
 
         Args:
+            *args: Q conditions
             **kwargs: Field lookup expressions
 
         Returns:
             Filtered QuerySet
         """
-        return self.get_queryset().filter(**kwargs)
+        return self.get_queryset().filter(*args, **kwargs)
 
-    def exclude(self, **kwargs: Any) -> "KMLQuerySet[T]":
+    def exclude(self, *args: "Q", **kwargs: Any) -> "KMLQuerySet[T]":
         """
         Exclude elements that match the given filters.
 
         Args:
+            *args: Q conditions
             **kwargs: Field lookup expressions
 
         Returns:
             QuerySet with non-matching elements
         """
-        return self.get_queryset().exclude(**kwargs)
+        return self.get_queryset().exclude(*args, **kwargs)
 
     def get(self, **kwargs: Any) -> T:
         """
@@ -413,6 +428,30 @@ class KMLManager(Generic[T]):
         """
         return self.get_queryset().last()
 
+    def earliest(self, *fields: str) -> "Optional[T]":
+        """
+        Get the first element in the given field order, without sorting.
+
+        Args:
+            *fields: Field names with optional '-' prefix for descending order
+
+        Returns:
+            First element in that order or None if empty
+        """
+        return self.get_queryset().earliest(*fields)
+
+    def latest(self, *fields: str) -> "Optional[T]":
+        """
+        Get the last element in the given field order, without sorting.
+
+        Args:
+            *fields: Field names with optional '-' prefix for descending order
+
+        Returns:
+            Last element in that order or None if empty
+        """
+        return self.get_queryset().latest(*fields)
+
     def count(self) -> int:
         """
         Count the number of elements.
@@ -422,14 +461,33 @@ class KMLManager(Generic[T]):
         """
         return len(self.elements)
 
-    def exists(self) -> bool:
+    def exists(self, **kwargs: Any) -> bool:
         """
-        Check if any elements exist.
+        Check if any elements exist, optionally matching field lookups.
+
+        Args:
+            **kwargs: Optional field lookup expressions; scanning stops at the
+                first match
 
         Returns:
             True if elements exist
         """
-        return bool(self.elements)
+        if not kwargs:
+            return bool(self.elements)
+        return self.get_queryset().exists(**kwargs)
+
+    def tally(self, **counts: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Count the elements matching several sets of lookups at once.
+
+        Args:
+            **counts: Result names mapped to a dict of field lookups, or to None
+                to count every element
+
+        Returns:
+            Dictionary mapping each result name to its count
+        """
+        return self.get_queryset().tally(**counts)
 
     def none(self) -> "KMLQuerySet[T]":
         """
@@ -467,8 +525,13 @@ class KMLManager(Generic[T]):
 
         Returns:
             QuerySet with nearby elements
+
+        Raises:
+            KMLValidationError: If the center coordinates are out of range
         """
-        return self.get_queryset().near(longitude, latitude, radius_km)
+        # Reject a bad center before the spatial cache reads every element
+        near_center(longitude, latitude)
+        return self._spatial_queryset().near(longitude, latitude, radius_km)
 
     def within_bounds(
         self, north: float, south: float, east: float, west: float
@@ -484,8 +547,37 @@ class KMLManager(Generic[T]):
 
         Returns:
             QuerySet with elements in bounds
+
+        Raises:
+            KMLInvalidCoordinates: If a bound is out of range or south is above north
+        """
+        check_bounds(north, south, east, west)
+        return self._spatial_queryset().within_bounds(north, south, east, west)
+
+    def _spatial_queryset(self) -> "KMLQuerySet[T]":
+        """
+        Return a QuerySet of the elements for near() and within_bounds().
+
+        Large QuerySets index their element coordinates in sorted NumPy columns
+        on the first spatial query and rebuild the index only when an element's
+        coordinates change. The QuerySet is kept between calls while the manager
+        holds the same elements, so repeated spatial queries skip the rebuild.
+
+        Returns:
+            QuerySet with all managed elements
         """
-        return self.get_queryset().within_bounds(north, south, east, west)
+        elements = self.elements
+        if not HAS_NUMPY or len(elements) < COORDINATE_ARRAYS_MIN_ELEMENTS:
+            return self.get_queryset()
+
+        cached = self._spatial_cache
+        # List comparison checks identity first and runs in C
+        if cached is not None and cached.elements == elements:
+            return cached
+
+        queryset = self.get_queryset()
+        self._spatial_cache = queryset
+        return queryset
 
     def has_coordinates(self) -> "KMLQuerySet[T]":
         """
@@ -505,17 +597,43 @@ class KMLManager(Generic[T]):
         """
         return self.get_queryset().valid_coordinates()
 
+    def coordinate_arrays(
+        self,
+    ) -> Tuple["NDArray[np.float64]", "NDArray[np.float64]", "NDArray[np.float64]"]:
+        """
+        Return the coordinates of the managed elements as NumPy arrays.
+
+        Returns:
+            Tuple of (longitudes, latitudes, altitudes) float64 arrays, NaN for
+            elements without coordinates
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        return self.get_queryset().coordinate_arrays()
+
     # Element management methods
 
     def add(self, *elements: T) -> None:
         """
         Add elements to this manager.
 
+        Elements already in the manager, or repeated in the arguments, are
+        skipped. Adding many elements in one call checks membership against a
+        set built once, instead of scanning the element list per element.
+
         Args:
             *elements: KML elements to add
         """
+        if len(elements) == 1:
+            if elements[0] not in self._elements:
+                self._elements.append(elements[0])
+            return
+
+        present = {id(element) for element in self._elements}
         for element in elements:
-            if element not in self.elements:
+            if id(element) not in present:
+                present.add(id(element))
                 self._elements.append(element)
 
     def remove(self, *elements: T) -> None:
@@ -532,6 +650,7 @@ class KMLManager(Generic[T]):
     def clear(self) -> None:
         """Remove all elements from this manager."""
         self._elements.clear()
+        self._spatial_cache = None
 
     def create(self, **kwargs: Any) -> T:
         """
@@ -5,16 +5,28 @@ This module provides the KMLQuerySet class that implements all the query
 methods like filter(), exclude(), get(), etc. in a Django-compatible way.
 """
 
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods, too-many-instance-attributes, too-many-lines
+import keyword
 import logging
 import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Set,
+    Tuple,
+    Type,
     Union,
     Generic,
     TypeVar,
@@ -28,14 +40,446 @@ from .exceptions import (
     KMLValidationError,
 )
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 if TYPE_CHECKING:
-    from ..models.point import Coordinate
+    from numpy.typing import NDArray
+
+    from ..models.point import Coordinate, Point
     from ..models.base import KMLElement
 
 
 T = TypeVar("T", bound="KMLElement")
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """
+    Compile a regex lookup pattern, caching the result by pattern and flags.
+
+    Args:
+        pattern: Regular expression source
+        flags: ``re`` module flags
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+def _regex_pattern(value: Any, flags: int = 0) -> "re.Pattern[str]":
+    """
+    Return the compiled pattern for a regex/iregex lookup value.
+
+    Compiled patterns are used as given, adding ``flags`` only if they are
+    missing; anything else is converted to str and compiled through the cache.
+
+    Args:
+        value: Pattern source or a compiled ``re.Pattern``
+        flags: ``re`` module flags the lookup requires
+
+    Returns:
+        Compiled pattern
+    """
+    if isinstance(value, re.Pattern):
+        if value.flags & flags == flags:
+            return value
+        return _compile_pattern(value.pattern, value.flags | flags)
+    return _compile_pattern(str(value), flags)
+
+
+@lru_cache(maxsize=None)
+def _coordinate_types() -> Tuple[Type["Point"], Type["Coordinate"]]:
+    """
+    Return the Point and Coordinate classes.
+
+    The models import this module, so they cannot be imported at module level;
+    caching the lookup keeps per-element coordinate extraction from paying for
+    an import statement on every call.
+
+    Returns:
+        Tuple of (Point, Coordinate)
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..models.point import Coordinate, Point
+
+    return Point, Coordinate
+
+
+def near_center(longitude: float, latitude: float) -> "Coordinate":
+    """
+    Build the center of a near() query, validating its ranges.
+
+    Args:
+        longitude: Center longitude (-180 to 180)
+        latitude: Center latitude (-90 to 90)
+
+    Returns:
+        Center coordinate
+
+    Raises:
+        KMLValidationError: If the coordinates are out of range
+    """
+    return _coordinate_types()[1](longitude=longitude, latitude=latitude, altitude=0.0)
+
+
+def check_bounds(north: float, south: float, east: float, west: float) -> None:
+    """
+    Validate the bounding box of a within_bounds() query.
+
+    Args:
+        north: Northern boundary (max latitude, -90 to 90)
+        south: Southern boundary (min latitude, not above north)
+        east: Eastern boundary (max longitude, -180 to 180)
+        west: Western boundary (min longitude, -180 to 180)
+
+    Raises:
+        KMLInvalidCoordinates: If a bound is out of range or south is above north
+    """
+    if not -90 <= south <= north <= 90:
+        raise KMLInvalidCoordinates("Invalid latitude bounds")
+    if not (-180 <= west <= 180 and -180 <= east <= 180):
+        raise KMLInvalidCoordinates("Invalid longitude bounds")
+
+
+@lru_cache(maxsize=256)
+def _row_maker(fields: Tuple[str, ...]) -> Callable[[Iterable[Any]], Tuple[Any, ...]]:
+    """
+    Build the named tuple type for values_list(named=True) rows, once per field list.
+
+    Dotted paths become ``a__b`` attributes; any other name that is not a
+    valid identifier is replaced by its position (``_0``, ``_1``, ...).
+
+    Args:
+        fields: Field names requested from values_list()
+
+    Returns:
+        The ``_make`` constructor of a named tuple with one field per requested field
+    """
+    names = [field.replace(".", "__") for field in fields]
+    row_type: Any = namedtuple("Row", names, rename=True)  # type: ignore[misc]
+    row_make: Callable[[Iterable[Any]], Tuple[Any, ...]] = row_type._make
+    return row_make
+
+
+# Lookup type -> predicate(field_value, filter_value). Looked up once per filter
+# expression instead of walking an if/elif chain for every element.
+_LOOKUPS: Dict[str, Callable[[Any, Any], bool]] = {
+    # String lookups
+    "exact": lambda fv, v: bool(fv == v),
+    "iexact": lambda fv, v: str(fv).lower() == str(v).lower(),
+    "contains": lambda fv, v: str(v) in str(fv),
+    "icontains": lambda fv, v: str(v).lower() in str(fv).lower(),
+    "startswith": lambda fv, v: str(fv).startswith(str(v)),
+    "istartswith": lambda fv, v: str(fv).lower().startswith(str(v).lower()),
+    "endswith": lambda fv, v: str(fv).endswith(str(v)),
+    "iendswith": lambda fv, v: str(fv).lower().endswith(str(v).lower()),
+    "regex": lambda fv, v: bool(_regex_pattern(v).search(str(fv))),
+    "iregex": lambda fv, v: bool(_regex_pattern(v, re.IGNORECASE).search(str(fv))),
+    # Comparison lookups
+    "gt": lambda fv, v: bool(fv > v),
+    "gte": lambda fv, v: bool(fv >= v),
+    "lt": lambda fv, v: bool(fv < v),
+    "lte": lambda fv, v: bool(fv <= v),
+    # Range and membership lookups
+    "in": lambda fv, v: bool(fv in v),
+    "range": lambda fv, v: bool(v[0] <= fv <= v[1]),
+    "isnull": lambda fv, v: bool((fv is None) == v),
+}
+
+# Estimated selectivity rank for each lookup type (lower = rejects more elements
+# and/or is cheaper to evaluate). Filters are evaluated in this order so that
+# cheap, selective predicates short-circuit before expensive string/regex ones.
+_LOOKUP_SELECTIVITY: Dict[str, int] = {
+    "exact": 0,
+    "iexact": 1,
+    "in": 1,
+    "range": 2,
+    "gt": 3,
+    "gte": 3,
+    "lt": 3,
+    "lte": 3,
+    "startswith": 4,
+    "endswith": 4,
+    "istartswith": 5,
+    "iendswith": 5,
+    "contains": 5,
+    "icontains": 6,
+    "regex": 7,
+    "iregex": 7,
+    "isnull": 8,
+}
+
+
+# Minimum queryset size at which near() and within_bounds() build NumPy
+# coordinate arrays instead of checking elements one at a time
+COORDINATE_ARRAYS_MIN_ELEMENTS = 512
+
+
+class _ParsedLookup(NamedTuple):
+    """A ``field__lookup=value`` filter expression split into its parts."""
+
+    field_name: str
+    lookup_type: str
+    value: Any
+
+
+# Source templates used by _compile_selector to inline each lookup. ``{v}`` is the
+# (non-None) field value and ``{c}`` the filter value after _SELECTOR_CONSTANTS.
+_SELECTOR_TEMPLATES: Dict[str, str] = {
+    "exact": "{v} == {c}",
+    "iexact": "str({v}).lower() == {c}",
+    "contains": "{c} in str({v})",
+    "icontains": "{c} in str({v}).lower()",
+    "startswith": "str({v}).startswith({c})",
+    "istartswith": "str({v}).lower().startswith({c})",
+    "endswith": "str({v}).endswith({c})",
+    "iendswith": "str({v}).lower().endswith({c})",
+    "regex": "{c}.search(str({v})) is not None",
+    "iregex": "{c}.search(str({v})) is not None",
+    "gt": "{v} > {c}",
+    "gte": "{v} >= {c}",
+    "lt": "{v} < {c}",
+    "lte": "{v} <= {c}",
+    "in": "{v} in {c}",
+    "range": "{c}[0] <= {v} <= {c}[1]",
+}
+
+
+def _frozen_members(value: Any) -> Any:
+    """
+    Return an ``in`` lookup's list, tuple or set value as a frozenset.
+
+    Values of other types, or containing unhashable items, are returned unchanged.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        try:
+            return frozenset(value)
+        except TypeError:
+            pass
+    return value
+
+
+# Filter value preparation done once per filter() call instead of per element
+_SELECTOR_CONSTANTS: Dict[str, Callable[[Any], Any]] = {
+    "in": _frozen_members,
+    "iexact": lambda v: str(v).lower(),
+    "contains": str,
+    "icontains": lambda v: str(v).lower(),
+    "startswith": str,
+    "istartswith": lambda v: str(v).lower(),
+    "endswith": str,
+    "iendswith": lambda v: str(v).lower(),
+    "regex": _regex_pattern,
+    "iregex": lambda v: _regex_pattern(v, re.IGNORECASE),
+}
+
+
+def _identity(value: Any) -> Any:
+    """Return value unchanged."""
+    return value
+
+
+_Selector = Callable[[List[Any], bool, Tuple[Any, ...]], List[int]]
+
+
+def _is_attribute_path(field_name: str) -> bool:
+    """Return True if every part of a dotted field path can be written as e.part."""
+    return all(
+        part.isidentifier() and not keyword.iskeyword(part) for part in field_name.split(".")
+    )
+
+
+# Filter value types for which ``None == value`` is always False, so an exact
+# lookup needs no separate None check
+_NONE_UNEQUAL_TYPES = frozenset({str, int, float, bool})
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(
+    signature: Tuple[Tuple[str, str, Optional[type]], ...], first_only: bool = False
+) -> _Selector:
+    """
+    Generate a filter loop specialized for a sequence of field lookups.
+
+    The generated function inlines attribute access and the comparison for each
+    lookup, so the per-element loop does no lookup dispatch or field path
+    splitting. Filter values are passed in as arguments, so one function serves
+    every filter() call with the same fields, lookup types and value types.
+    Exact lookups on a str, int, float or bool value compile to a bare ``==``,
+    and in lookups on a list, tuple or set of hashable items to a set lookup.
+
+    Semantics match KMLQuerySet._matches_filters: lookups are checked in order
+    and stop at the first failure, a missing field never matches, and a None
+    field value only matches ``isnull=True``.
+
+    Args:
+        signature: (field_name, lookup_type, value_type) triples; field names
+            must pass _is_attribute_path(); value_type is set only for exact
+            lookups whose filter value type is in _NONE_UNEQUAL_TYPES, and is
+            frozenset for in lookups whose value _frozen_members() can freeze
+        first_only: If True, return as soon as one element is selected
+
+    Returns:
+        Function ``(elements, negate, constants) -> positions``
+    """
+    lines = [
+        "def _select(elements, negate, constants):",
+        "    selected = []",
+        "    append = selected.append",
+    ]
+    if signature:
+        names = "".join(f"c{k}, " for k in range(len(signature)))
+        lines.append(f"    ({names}) = constants")
+    lines += ["    for i, e in enumerate(elements):", "        matched = True"]
+    for k, (field_name, lookup_type, value_type) in enumerate(signature):
+        if lookup_type == "isnull":
+            test = f"bool(c{k}) if v is None else False == c{k}"
+        elif lookup_type == "exact" and value_type is not None:
+            test = f"v == c{k}"
+        else:
+            test = "v is not None and " + _SELECTOR_TEMPLATES[lookup_type].format(v="v", c=f"c{k}")
+        lines += [
+            "        if matched:",
+            "            try:",
+            f"                v = e.{field_name}",
+            "            except AttributeError:",
+            "                matched = False",
+            "            else:",
+        ]
+        if lookup_type == "in" and value_type is not None:
+            # Hash lookup into the frozenset; unhashable values compare one by one
+            lines += [
+                "                try:",
+                f"                    matched = {test}",
+                "                except TypeError:",
+                f"                    matched = any(v == member for member in c{k})",
+            ]
+        else:
+            lines.append(f"                matched = {test}")
+    lines += [
+        "        if bool(matched) != negate:",
+        "            return [i]" if first_only else "            append(i)",
+        "    return selected",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    selector: _Selector = namespace["_select"]
+    return selector
+
+
+@lru_cache(maxsize=256)
+def _compile_values(fields: Tuple[str, ...]) -> Callable[[List[Any]], List[Dict[str, Any]]]:
+    """
+    Generate a values() loop that builds each row as a dict literal.
+
+    The generated comprehension reads every field with inline attribute access,
+    so a row costs one dict display instead of a nested dict comprehension with
+    a getter call per field.
+
+    Args:
+        fields: Field names that all pass _is_attribute_path()
+
+    Returns:
+        Function ``(elements) -> rows``; raises AttributeError if an element is
+        missing a field
+    """
+    row = ", ".join(f"{field!r}: e.{field}" for field in fields)
+    namespace: Dict[str, Any] = {}
+    exec(  # pylint: disable=exec-used
+        f"def _values(elements):\n    return [{{{row}}} for e in elements]", namespace
+    )
+    values: Callable[[List[Any]], List[Dict[str, Any]]] = namespace["_values"]
+    return values
+
+
+def _selector_key(parsed: _ParsedLookup) -> Tuple[str, str, Optional[type]]:
+    """Return the _compile_selector() signature entry for a parsed lookup."""
+    if parsed.lookup_type == "in":
+        frozen = isinstance(_frozen_members(parsed.value), frozenset)
+        return (parsed.field_name, parsed.lookup_type, frozenset if frozen else None)
+    value_type = type(parsed.value)
+    if parsed.lookup_type != "exact" or value_type not in _NONE_UNEQUAL_TYPES:
+        return (parsed.field_name, parsed.lookup_type, None)
+    return (parsed.field_name, parsed.lookup_type, value_type)
+
+
+class Q:
+    """
+    A reusable filter condition, combinable with ``&``, ``|`` and ``~``.
+
+    The lookups are parsed once when the Q is created, so a Q applied with
+    filter() or exclude() on many QuerySets skips parsing the keyword
+    arguments each time. Similar to Django's Q object.
+
+    Example:
+        >>> visible_stores = Q(visibility=True) & Q(name__icontains='store')
+        >>> kml.placemarks.all().filter(visible_stores | Q(name='Headquarters'))
+        >>> kml.placemarks.all().exclude(~Q(visibility=True))
+    """
+
+    __slots__ = ("lookups", "children", "connector", "negated")
+
+    AND = "AND"
+    OR = "OR"
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize a Q from field lookups.
+
+        Args:
+            **kwargs: Field lookup expressions, as for filter(); all must match
+
+        Raises:
+            KMLQueryError: If a lookup type is not supported
+        """
+        self.lookups: List[_ParsedLookup] = KMLQuerySet._parse_lookups(kwargs)
+        self.children: Tuple["Q", ...] = ()
+        self.connector = self.AND
+        self.negated = False
+
+    def _combine(self, other: "Q", connector: str) -> "Q":
+        """Return a Q joining this Q and another with AND or OR."""
+        if not isinstance(other, Q):
+            return NotImplemented
+        combined = Q()
+        combined.children = (self, other)
+        combined.connector = connector
+        return combined
+
+    def __and__(self, other: "Q") -> "Q":
+        """Match elements matching both conditions."""
+        return self._combine(other, self.AND)
+
+    def __or__(self, other: "Q") -> "Q":
+        """Match elements matching either condition."""
+        return self._combine(other, self.OR)
+
+    def __invert__(self) -> "Q":
+        """Match elements not matching this condition."""
+        inverted = Q()
+        inverted.lookups = self.lookups
+        inverted.children = self.children
+        inverted.connector = self.connector
+        inverted.negated = not self.negated
+        return inverted
+
+    def __repr__(self) -> str:
+        """Detailed representation of the condition."""
+        if self.children:
+            inner = f" {self.connector} ".join(map(repr, self.children))
+        else:
+            inner = ", ".join(
+                f"{field}__{lookup}={value!r}" for field, lookup, value in self.lookups
+            )
+        return f"~Q({inner})" if self.negated else f"Q({inner})"
+
+
 class KMLQuerySet(Generic[T]):
     """Typed QuerySet for KML elements.
 
@@ -43,9 +487,23 @@ class KMLQuerySet(Generic[T]):
     operations. It is generic in the element type so callers receive precise
     T / Optional[T] / List[T] return types.
 
+    Every query reads the elements' current field values, so one QuerySet can
+    be queried repeatedly while its elements change.
+
     Similar to Django's QuerySet.
     """
 
+    # A QuerySet is created for every filter()/order_by()/... link in a chain, so
+    # its state lives in slots rather than a per-instance __dict__
+    __slots__ = (
+        "_elements",
+        "_ordered",
+        "_order_by_fields",
+        "_distinct",
+        "_coordinate_cache",
+        "__weakref__",
+    )
+
     def __init__(self, elements: Optional[List[T]] = None) -> None:
         """
         Initialize a QuerySet with a list of elements.
@@ -57,11 +515,33 @@ class KMLQuerySet(Generic[T]):
         self._ordered = False
         self._order_by_fields: List[str] = []
         self._distinct = False
+        # (snapshot of element coordinates, coordinate columns built from them)
+        # kept by _coordinate_columns() for repeated near()/within_bounds() calls
+        self._coordinate_cache: Optional[Tuple[List[Any], Any]] = None
+
+    @classmethod
+    def _from_list(cls, elements: List[T]) -> "KMLQuerySet[T]":
+        """
+        Wrap a list built for the new QuerySet without the copy __init__ makes.
+
+        Args:
+            elements: A fresh list that nothing else holds a reference to
+
+        Returns:
+            New QuerySet that owns ``elements``
+        """
+        qs = cls()
+        qs._elements = elements
+        return qs
 
     def __iter__(self) -> Iterator[T]:
         """Make QuerySet iterable."""
         return iter(self._elements)
 
+    def __contains__(self, element: object) -> bool:
+        """Check membership against the element list directly instead of via __iter__."""
+        return element in self._elements
+
     def __len__(self) -> int:
         """Return the number of elements in the QuerySet."""
         return len(self._elements)
@@ -85,12 +565,12 @@ class KMLQuerySet(Generic[T]):
         if isinstance(key, int):
             return self._elements[key]
         if isinstance(key, slice):
-            return self.__class__(self._elements[key])
+            return self._from_list(self._elements[key])
         raise TypeError("QuerySet indices must be integers or slices")
 
     def __bool__(self) -> bool:
         """Return True if QuerySet has any elements."""
-        return bool(self._elements) or False
+        return bool(self._elements)
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
@@ -101,9 +581,11 @@ class KMLQuerySet(Generic[T]):
         """
         Returns the list of KMLElement objects associated with this queryset.
 
+        The underlying list is returned without copying, so reading it is O(1).
+        Mutating it changes this QuerySet; use list(qs.elements) for a copy.
+
         Returns:
-            Optional[List["KMLElement"]]: A list of KMLElement instances if available, otherwise
-                None.
+            List["KMLElement"]: The KMLElement instances in this QuerySet.
         """
         return self._elements
 
@@ -138,9 +620,9 @@ class KMLQuerySet(Generic[T]):
         This method exists for Django compatibility and returns a new
         QuerySet with the same elements.
         """
-        return self.__class__(self._elements.copy())
+        return self._from_list(self._elements.copy())
 
-    def filter(self, **kwargs: Any) -> "KMLQuerySet[T]":
+    def filter(self, *args: "Q", **kwargs: Any) -> "KMLQuerySet[T]":
         """
         Filter elements based on field lookups.
 
@@ -149,22 +631,23 @@ class KMLQuerySet(Generic[T]):
         - coordinates__latitude__gte=39.0
         - visibility=True
 
+        Lookups are evaluated cheapest and most selective first (exact before
+        icontains before regex, and so on), which only changes which error
+        surfaces when a lookup cannot compare a field value.
+
         Args:
-            **kwargs: Field lookup expressions
+            *args: Q conditions that must also match
+            **kwargs: Field lookup expressions; pass ``_preserve_order=True``
+                to evaluate them left to right as given
 
         Returns:
             New QuerySet with filtered elements
         """
-        filtered_elements = []
-
-        for element in self._elements:
-            if self._matches_filters(element, kwargs):
-                filtered_elements.append(element)
-
-        new_qs = self.__class__(filtered_elements)
-        new_qs.is_ordered = self.is_ordered
-        new_qs.order_by_fields = self.order_by_fields
-        return new_qs
+        reorder = not kwargs.pop("_preserve_order", False)
+        lookups = self._parse_lookups(kwargs, reorder)
+        if args:
+            return self._from_positions(self._q_positions(args, lookups, negate=False))
+        return self._filtered(lookups, negate=False)
 
     @property
     def is_ordered(self) -> bool:
@@ -231,7 +714,7 @@ class KMLQuerySet(Generic[T]):
         """
         self._distinct = bool(value)
 
-    def exclude(self, **kwargs: Any) -> "KMLQuerySet[T]":
+    def exclude(self, *args: "Q", **kwargs: Any) -> "KMLQuerySet[T]":
         """
         Exclude elements that match the given filters.
 
@@ -239,21 +722,18 @@ class KMLQuerySet(Generic[T]):
         match the criteria.
 
         Args:
-            **kwargs: Field lookup expressions
+            *args: Q conditions that must also match for an element to be excluded
+            **kwargs: Field lookup expressions; pass ``_preserve_order=True``
+                to evaluate them left to right as given
 
         Returns:
             New QuerySet with non-matching elements
         """
-        filtered_elements = []
-
-        for element in self._elements:
-            if not self._matches_filters(element, kwargs):
-                filtered_elements.append(element)
-
-        new_qs = self.__class__(filtered_elements)
-        new_qs.is_ordered = self.is_ordered
-        new_qs.order_by_fields = self.order_by_fields
-        return new_qs
+        reorder = not kwargs.pop("_preserve_order", False)
+        lookups = self._parse_lookups(kwargs, reorder)
+        if args:
+            return self._from_positions(self._q_positions(args, lookups, negate=True))
+        return self._filtered(lookups, negate=True)
 
     def get(self, **kwargs: Any) -> "T":
         """
@@ -269,16 +749,17 @@ class KMLQuerySet(Generic[T]):
             KMLElementNotFound: If no elements match
             KMLMultipleElementsReturned: If multiple elements match
         """
-        filtered = self.filter(**kwargs)
+        # Select positions directly rather than building a filtered QuerySet
+        positions = self._select(self._parse_lookups(kwargs), negate=False)
 
-        if len(filtered) == 0:
+        if not positions:
             element_type = self._elements[0].__class__.__name__ if self._elements else "KMLElement"
             raise KMLElementNotFound(element_type, kwargs)
-        if len(filtered) > 1:
-            element_type = filtered.elements[0].__class__.__name__
-            raise KMLMultipleElementsReturned(element_type, len(filtered), kwargs)
+        if len(positions) > 1:
+            element_type = self._elements[positions[0]].__class__.__name__
+            raise KMLMultipleElementsReturned(element_type, len(positions), kwargs)
 
-        return filtered.elements[0]
+        return self._elements[positions[0]]
 
     def first(self) -> Optional[T]:
         """
@@ -298,6 +779,39 @@ class KMLQuerySet(Generic[T]):
         """
         return self._elements[-1] if self._elements else None
 
+    def earliest(self, *fields: str) -> Optional[T]:
+        """
+        Get the element that order_by(*fields).first() would return, without sorting.
+
+        Selects the element in one pass per field instead of sorting the whole
+        QuerySet. Ties are resolved exactly as the stable sort in order_by() does.
+
+        Args:
+            *fields: Field names with optional '-' prefix for descending order
+
+        Returns:
+            First element in that order, or None if QuerySet is empty
+
+        Raises:
+            KMLQueryError: If an element lacks one of the fields
+        """
+        return self._ordered_extreme(fields, last=False)
+
+    def latest(self, *fields: str) -> Optional[T]:
+        """
+        Get the element that order_by(*fields).last() would return, without sorting.
+
+        Args:
+            *fields: Field names with optional '-' prefix for descending order
+
+        Returns:
+            Last element in that order, or None if QuerySet is empty
+
+        Raises:
+            KMLQueryError: If an element lacks one of the fields
+        """
+        return self._ordered_extreme(fields, last=True)
+
     def count(self) -> int:
         """
         Return the number of elements in the QuerySet.
@@ -307,14 +821,57 @@ class KMLQuerySet(Generic[T]):
         """
         return len(self._elements)
 
-    def exists(self) -> bool:
+    def exists(self, **kwargs: Any) -> bool:
         """
-        Check if the QuerySet contains any elements.
+        Check if the QuerySet contains any elements, optionally matching lookups.
+
+        ``qs.exists(name__icontains='store')`` is equivalent to
+        ``qs.filter(name__icontains='store').exists()`` but stops scanning at the
+        first match instead of building the filtered QuerySet.
+
+        Args:
+            **kwargs: Optional field lookup expressions, as for filter()
 
         Returns:
-            True if QuerySet has elements, False otherwise
+            True if any element (matching the lookups, if given) exists
         """
-        return bool(self._elements)
+        if not kwargs:
+            return bool(self._elements)
+        return bool(self._select(self._parse_lookups(kwargs), negate=False, first_only=True))
+
+    def tally(self, **counts: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Count the elements matching several sets of lookups at once.
+
+        ``qs.tally(total=None, visible={'visibility': True})`` returns the same
+        numbers as ``qs.count()`` and ``qs.filter(visibility=True).count()`` but
+        counts matches without building a filtered QuerySet for each.
+
+        Args:
+            **counts: Result names mapped to a dict of field lookups as for
+                filter(), or to None to count every element
+
+        Returns:
+            Dictionary mapping each result name to its count
+
+        Raises:
+            KMLQueryError: If a lookup type is not supported
+
+        Example:
+            >>> summary = kml.placemarks.children().tally(
+            ...     total=None,
+            ...     visible={'visibility': True},
+            ...     stores={'name__icontains': 'store'},
+            ... )
+        """
+        return {
+            name: (
+                len(self._elements)
+                if not lookups
+                else len(self._select(self._parse_lookups(lookups), negate=False))
+            )
+            for name, lookups in counts.items()
+        }
 
     def none(self) -> "KMLQuerySet[T]":
         """
@@ -351,11 +908,8 @@ class KMLQuerySet(Generic[T]):
             clean_field = field.lstrip("-")
 
             try:
-
-                def _key_fn(elem: T, cf: str = clean_field) -> Any:
-                    return self._get_field_value(elem, cf)
-
-                new_qs.elements.sort(key=_key_fn, reverse=reverse)
+                # attrgetter resolves dotted paths in C, matching _get_field_value
+                new_qs.elements.sort(key=attrgetter(clean_field), reverse=reverse)
             except AttributeError as ae:
                 raise KMLQueryError(f"Cannot order by field '{clean_field}'", clean_field) from ae
 
@@ -379,17 +933,13 @@ class KMLQuerySet(Generic[T]):
         Returns:
             New QuerySet with unique elements only
         """
-        seen = set()
-        unique_elements = []
-
+        # Dicts keep insertion order, so the first element seen for a key wins
+        unique_elements: Dict[Any, T] = {}
         for element in self._elements:
             # Use id if available, otherwise use object id
-            key = element.id if element.id else id(element)
-            if key not in seen:
-                seen.add(key)
-                unique_elements.append(element)
+            unique_elements.setdefault(element.id or id(element), element)
 
-        new_qs = self.__class__(unique_elements)
+        new_qs = self._from_list(list(unique_elements.values()))
         new_qs.is_distinct = True
         new_qs.is_ordered = self.is_ordered
         new_qs.order_by_fields = self._order_by_fields.copy()
@@ -409,6 +959,21 @@ class KMLQuerySet(Generic[T]):
             # Return all fields
             return [element.to_dict() for element in self._elements]
 
+        # Rows are built by a generated loop, or by one C-level getter per field
+        # when a field name cannot be written as an attribute path. Both resolve
+        # dotted paths like _get_field_value; an element missing a field falls
+        # back to the loop below.
+        getters = [(field, attrgetter(field)) for field in fields]
+        try:
+            if all(_is_attribute_path(field) for field in fields):
+                return _compile_values(fields)(self._elements)
+            if len(getters) == 1:
+                field, getter = getters[0]
+                return [{field: value} for value in map(getter, self._elements)]
+            return [{field: get(element) for field, get in getters} for element in self._elements]
+        except AttributeError:
+            pass
+
         result = []
         for element in self._elements:
             item = {}
@@ -421,19 +986,43 @@ class KMLQuerySet(Generic[T]):
 
         return result
 
-    def values_list(self, *fields: str, flat: bool = False) -> List[Any]:
+    def values_list(self, *fields: str, flat: bool = False, named: bool = False) -> List[Any]:
         """
         Return a list of tuples with specified field values.
 
         Args:
             *fields: Field names to include in tuples
             flat: If True and only one field, return flat list of values
+            named: If True, return named tuples with one attribute per field,
+                a compact alternative to the dicts returned by values()
 
         Returns:
             List of tuples (or flat list if flat=True and one field)
+
+        Raises:
+            ValueError: If flat=True is used with several fields or with named=True
+
+        Example:
+            >>> rows = kml.placemarks.all().values_list('name', 'visibility', named=True)
+            >>> rows[0].name
         """
+        if flat and named:
+            raise ValueError("values_list() cannot use both flat=True and named=True")
         if flat and len(fields) != 1:
             raise ValueError("values_list() with flat=True requires exactly one field")
+        if named:
+            return list(map(_row_maker(fields), self.values_list(*fields)))
+
+        if fields:
+            # attrgetter returns a tuple when given several fields, so every case
+            # maps in C. An element missing a field falls back to the loop below.
+            getter = attrgetter(*fields)
+            try:
+                if flat or len(fields) > 1:
+                    return list(map(getter, self._elements))
+                return [(value,) for value in map(getter, self._elements)]
+            except AttributeError:
+                pass
 
         result = []
         for element in self._elements:
@@ -451,6 +1040,37 @@ class KMLQuerySet(Generic[T]):
 
         return result
 
+    def distinct_count(self, field: str) -> int:
+        """
+        Count the distinct values of a field.
+
+        Equivalent to ``len(set(qs.values_list(field, flat=True)))`` but the
+        values are streamed into the set without building the list first.
+
+        Args:
+            field: Field name or dotted path (e.g., 'name' or 'coordinates.altitude')
+
+        Returns:
+            Number of distinct values; elements missing the field count as None
+
+        Raises:
+            TypeError: If a field value is unhashable
+        """
+        try:
+            return len(set(map(attrgetter(field), self._elements)))
+        except AttributeError:
+            pass
+
+        seen: Set[Any] = set()
+        add = seen.add
+        get_value = attrgetter(field)
+        for element in self._elements:
+            try:
+                add(get_value(element))
+            except AttributeError:
+                add(None)
+        return len(seen)
+
     # Geospatial-specific methods
 
     def near(
@@ -466,30 +1086,19 @@ class KMLQuerySet(Generic[T]):
 
         Returns:
             New QuerySet with nearby elements
-        """
-        # pylint: disable=import-outside-toplevel
-        from ..models.point import Coordinate
-        from ..spatial.calculations import (
-            SpatialCalculations,
-        )
 
-        center = Coordinate(longitude=longitude, latitude=latitude, altitude=0.0)
+        Raises:
+            KMLValidationError: If the center coordinates are out of range
+        """
+        # Validates the center before any element is looked at
+        center = near_center(longitude, latitude)
 
         if radius_km is None:
             return self.all()
 
-        filtered_elements = []
-        for element in self._elements:
-            try:
-                coords = self._point_coords(element)
-                if coords:
-                    distance = SpatialCalculations.distance_between(center, coords)
-                    if distance is not None and distance <= radius_km:
-                        filtered_elements.append(element)
-            except (ValueError, TypeError):
-                continue
-
-        return self.__class__(filtered_elements)
+        if HAS_NUMPY and len(self._elements) >= COORDINATE_ARRAYS_MIN_ELEMENTS:
+            return self._from_list(self._near_vectorized(center, radius_km))
+        return self._from_list(self._near_scalar(center, radius_km))
 
     def within_bounds(
         self, north: float, south: float, east: float, west: float
@@ -505,12 +1114,14 @@ class KMLQuerySet(Generic[T]):
 
         Returns:
             New QuerySet with elements in bounds
+
+        Raises:
+            KMLInvalidCoordinates: If a bound is out of range or south is above north
         """
-        # Validate bounds
-        if not -90 <= south <= north <= 90:
-            raise KMLInvalidCoordinates("Invalid latitude bounds")
-        if not -180 <= west <= 180 and -180 <= east <= 180:
-            raise KMLInvalidCoordinates("Invalid longitude bounds")
+        check_bounds(north, south, east, west)
+
+        if HAS_NUMPY and len(self._elements) >= COORDINATE_ARRAYS_MIN_ELEMENTS:
+            return self._from_list(self._within_bounds_vectorized(north, south, east, west))
 
         filtered_elements = []
         for element in self._elements:
@@ -530,7 +1141,7 @@ class KMLQuerySet(Generic[T]):
             except (ValueError, TypeError):
                 continue
 
-        return self.__class__(filtered_elements)
+        return self._from_list(filtered_elements)
 
     def has_coordinates(self) -> "KMLQuerySet[T]":
         """
@@ -549,31 +1160,33 @@ class KMLQuerySet(Generic[T]):
             except (ValueError, TypeError):
                 continue
 
-        return self.__class__(filtered_elements)
+        return self._from_list(filtered_elements)
 
     def valid_coordinates(self) -> "KMLQuerySet[T]":
         """
         Filter elements with valid coordinate ranges.
 
         Uses the Coordinate class validation to ensure consistency with
-        the authoritative coordinate validation logic.
+        the authoritative coordinate validation logic. Elements without
+        coordinates are excluded too, so ``has_coordinates().valid_coordinates()``
+        selects the same elements as ``valid_coordinates()`` in one pass.
 
         Returns:
             New QuerySet with elements having valid coordinates
         """
+        coordinate_type = _coordinate_types()[1]
         filtered_elements = []
         for element in self._elements:
             try:
                 coords = self._point_coords(element)
-                if coords and coords.longitude is not None and coords.latitude is not None:
-                    # Import here to avoid circular imports
-                    from ..models.point import Coordinate  # pylint: disable=import-outside-toplevel
-
+                if type(coords) is coordinate_type:  # pylint: disable=unidiomatic-typecheck
+                    # Coordinates are validated when created and are immutable
+                    filtered_elements.append(element)
+                elif coords and coords.longitude is not None and coords.latitude is not None:
                     # Create a new Coordinate to validate ranges using the authoritative logic
-                    # This replaces manual range checks with the same validation used elsewhere
                     try:
                         altitude = getattr(coords, "altitude", 0.0)
-                        Coordinate(
+                        coordinate_type(
                             longitude=coords.longitude, latitude=coords.latitude, altitude=altitude
                         )
                         filtered_elements.append(element)
@@ -584,51 +1197,396 @@ class KMLQuerySet(Generic[T]):
                 # Problems extracting coordinates - skip this element
                 continue
 
-        return self.__class__(filtered_elements)
+        return self._from_list(filtered_elements)
+
+    def coordinate_arrays(
+        self,
+    ) -> Tuple["NDArray[np.float64]", "NDArray[np.float64]", "NDArray[np.float64]"]:
+        """
+        Return element coordinates as three NumPy arrays for vectorized work.
+
+        Row i of each array belongs to the i-th element of the QuerySet, so the
+        arrays can be combined with positional masks. Elements without readable
+        coordinates get NaN in all three arrays.
+
+        Returns:
+            Tuple of (longitudes, latitudes, altitudes) float64 arrays
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            >>> lons, lats, alts = kml.placemarks.all().coordinate_arrays()
+            >>> northern = lats > 39.0
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for coordinate_arrays()")
+
+        columns = np.full((3, len(self._elements)), np.nan, dtype=np.float64)
+        for i, element in enumerate(self._elements):
+            try:
+                coords = self._point_coords(element)
+            except (ValueError, TypeError):
+                continue
+            if coords:
+                columns[:, i] = (coords.longitude, coords.latitude, coords.altitude)
+        return columns[0], columns[1], columns[2]
 
     # Helper methods
 
-    def _matches_filters(self, element: T, filters: Dict[str, Any]) -> bool:
+    def _ordered_extreme(self, fields: Tuple[str, ...], last: bool) -> Optional[T]:
         """
-        Check if an element matches all the given filters.
+        Find the first or last element of order_by(*fields) in O(N) per field.
+
+        The candidates are narrowed field by field to those holding the best
+        value. For ``last`` the candidates are scanned in reverse, so that among
+        equal keys the element latest in the QuerySet wins, as after a stable sort.
 
         Args:
-            element: KML element to check
-            filters: Dictionary of field lookups
+            fields: Field names with optional '-' prefix for descending order
+            last: If True, find the last element instead of the first
 
         Returns:
-            True if element matches all filters
+            The element, or None if QuerySet is empty
+
+        Raises:
+            KMLQueryError: If an element lacks one of the fields
         """
+        candidates = self._elements[::-1] if last else self._elements
+        for field in fields:
+            clean_field = field.lstrip("-")
+            get_key = attrgetter(clean_field)
+            try:
+                if len(candidates) < 2:
+                    # Nothing left to compare, but a missing field must still raise
+                    for element in candidates:
+                        get_key(element)
+                    continue
+                keys = list(map(get_key, candidates))
+            except AttributeError as ae:
+                raise KMLQueryError(f"Cannot order by field '{clean_field}'", clean_field) from ae
+            best = max(keys) if field.startswith("-") != last else min(keys)
+            candidates = [element for element, key in zip(candidates, keys) if key == best]
+        return candidates[0] if candidates else None
+
+    @staticmethod
+    def _parse_lookups(filters: Dict[str, Any], reorder: bool = True) -> List[_ParsedLookup]:
+        """
+        Split filter keyword arguments into field names and lookup types.
+
+        Parsing happens once per filter() call rather than once per element.
+        The result is ordered by estimated selectivity so the per-element check
+        can stop at the first cheap predicate that fails.
+
+        Args:
+            filters: Dictionary of field lookups (e.g., {'name__icontains': 'park'})
+            reorder: If False, keep the lookups in the order given
+
+        Returns:
+            List of parsed lookups, most selective first (unless reorder is False)
+
+        Raises:
+            KMLQueryError: If a lookup type is not supported
+        """
+        lookups = []
         for lookup, value in filters.items():
-            if not self._matches_single_filter(element, lookup, value):
-                return False
-        return True
+            parts = lookup.split("__")
+            # Interned names make the dict and cache-key comparisons they feed
+            # into identity checks
+            field_name = sys.intern(parts[0])
+            lookup_type = sys.intern(parts[1]) if len(parts) > 1 else "exact"
+            if lookup_type not in _LOOKUPS:
+                raise KMLQueryError(f"Unsupported lookup type: {lookup_type}", field_name)
+            lookups.append(_ParsedLookup(field_name, lookup_type, value))
+        if reorder:
+            lookups.sort(key=lambda parsed: _LOOKUP_SELECTIVITY[parsed.lookup_type])
+        return lookups
 
-    def _matches_single_filter(self, element: T, lookup: str, value: Any) -> bool:
+    def _filtered(self, lookups: List[_ParsedLookup], negate: bool) -> "KMLQuerySet[T]":
         """
-        Check if an element matches a single filter.
+        Build the QuerySet returned by filter() and exclude().
+
+        The new QuerySet keeps this QuerySet's ordering flags.
 
         Args:
-            element: KML element to check
-            lookup: Field lookup string (e.g., 'name__icontains')
-            value: Value to match against
+            lookups: Parsed field lookups from _parse_lookups()
+            negate: If True, keep elements that do NOT match (exclude semantics)
 
         Returns:
-            True if element matches the filter
+            New QuerySet with the selected elements
+        """
+        return self._from_positions(self._select(lookups, negate))
+
+    def _from_positions(self, positions: List[int]) -> "KMLQuerySet[T]":
+        """
+        Build a QuerySet of the elements at the given positions.
+
+        Args:
+            positions: Ascending positions of elements in this QuerySet
+
+        Returns:
+            New QuerySet with the selected elements
+        """
+        # pylint: disable=protected-access
+        new_qs = self._from_list([self._elements[i] for i in positions])
+        new_qs._ordered = self._ordered
+        new_qs._order_by_fields = self._order_by_fields.copy()
+        return new_qs
+
+    def _q_positions(
+        self, conditions: Tuple[Q, ...], lookups: List[_ParsedLookup], negate: bool
+    ) -> List[int]:
+        """
+        Return positions of elements matching all Q conditions and lookups.
+
+        Args:
+            conditions: Q objects passed to filter() or exclude()
+            lookups: Parsed keyword lookups passed alongside them
+            negate: If True, return the positions that do NOT match
+
+        Returns:
+            Ascending positions of selected elements
+        """
+        selected = set(self._select(lookups, negate=False))
+        for condition in conditions:
+            if not selected:
+                break
+            selected &= self._q_matches(condition)
+        if negate:
+            return [i for i in range(len(self._elements)) if i not in selected]
+        return sorted(selected)
+
+    def _q_matches(self, condition: Q) -> Set[int]:
+        """
+        Return the set of positions of elements matching a Q condition.
+
+        Args:
+            condition: Leaf Q (lookups) or a Q combining two others
+
+        Returns:
+            Positions of matching elements
+        """
+        if not condition.children:
+            return set(self._select(condition.lookups, condition.negated))
+        left, right = (self._q_matches(child) for child in condition.children)
+        matched = left & right if condition.connector == Q.AND else left | right
+        if condition.negated:
+            return set(range(len(self._elements))) - matched
+        return matched
+
+    def _select(
+        self, lookups: List[_ParsedLookup], negate: bool, first_only: bool = False
+    ) -> List[int]:
         """
-        # Parse field lookup
-        parts = lookup.split("__")
-        field_name = parts[0]
-        lookup_type = parts[1] if len(parts) > 1 else "exact"
+        Return positions of elements that match all lookups (or not, when negated).
 
-        # Get field value
+        Lookups are checked per element using a loop generated by
+        _compile_selector(), unless a field name is not a valid attribute path.
+
+        Args:
+            lookups: Parsed field lookups from _parse_lookups()
+            negate: If True, select elements that do NOT match (exclude semantics)
+            first_only: If True, stop at the first selected element
+
+        Returns:
+            Positions of selected elements in their original order
+        """
+        if all(_is_attribute_path(parsed.field_name) for parsed in lookups):
+            selector = _compile_selector(tuple(map(_selector_key, lookups)), first_only)
+            constants = tuple(
+                _SELECTOR_CONSTANTS.get(parsed.lookup_type, _identity)(parsed.value)
+                for parsed in lookups
+            )
+            return selector(self._elements, negate, constants)
+
+        selected = (
+            i
+            for i, element in enumerate(self._elements)
+            if self._matches_filters(element, lookups) != negate
+        )
+        return list(islice(selected, 1) if first_only else selected)
+
+    def _near_scalar(self, center: "Coordinate", radius_km: float) -> List[T]:
+        """
+        Select elements within a radius, one element at a time.
+
+        Elements outside the circle's bounding latitude band and longitude range
+        are discarded with two comparisons before the exact Haversine distance
+        is computed.
+
+        Args:
+            center: Center coordinate
+            radius_km: Radius in kilometers
+
+        Returns:
+            Elements within the radius, in their original order
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..spatial.calculations import SpatialCalculations
+
+        min_lat, max_lat, max_lon_offset = SpatialCalculations.radius_bounds(
+            center.latitude, radius_km
+        )
+        filtered_elements = []
+        for element in self._elements:
+            try:
+                coords = self._point_coords(element)
+                if not coords or not min_lat <= coords.latitude <= max_lat:
+                    continue
+                if (
+                    max_lon_offset is not None
+                    and abs((coords.longitude - center.longitude + 180.0) % 360.0 - 180.0)
+                    > max_lon_offset
+                ):
+                    continue
+                distance = SpatialCalculations.distance_between(center, coords)
+                if distance is not None and distance <= radius_km:
+                    filtered_elements.append(element)
+            except (ValueError, TypeError):
+                continue
+        return filtered_elements
+
+    def _near_vectorized(self, center: "Coordinate", radius_km: float) -> List[T]:
+        """
+        Select elements within a radius using cached NumPy coordinate columns.
+
+        The columns are sorted by latitude, so the circle's bounding latitude
+        band is found by binary search. Only elements inside the band and the
+        bounding longitude range get an exact Haversine distance.
+
+        Args:
+            center: Center coordinate
+            radius_km: Radius in kilometers
+
+        Returns:
+            Elements within the radius, in their original order
+        """
+        # pylint: disable=import-outside-toplevel
+        from ..spatial.calculations import SpatialCalculations
+        from ..spatial.vectorized import haversine_distances
+
+        min_lat, max_lat, max_lon_offset = SpatialCalculations.radius_bounds(
+            center.latitude, radius_km
+        )
+        positions, lons, lats = self._coordinate_columns()
+        band = slice(
+            int(np.searchsorted(lats, min_lat, side="left")),
+            int(np.searchsorted(lats, max_lat, side="right")),
+        )
+        positions, lons, lats = positions[band], lons[band], lats[band]
+        if max_lon_offset is not None:
+            in_range = np.abs((lons - center.longitude + 180.0) % 360.0 - 180.0) <= max_lon_offset
+            positions, lons, lats = positions[in_range], lons[in_range], lats[in_range]
+
+        distances = haversine_distances(center.latitude, center.longitude, lats, lons)
+        selected = np.sort(positions[distances <= radius_km])
+        return [self._elements[i] for i in selected.tolist()]
+
+    def _within_bounds_vectorized(
+        self, north: float, south: float, east: float, west: float
+    ) -> List[T]:
+        """
+        Select elements inside a bounding box using cached NumPy coordinate columns.
+
+        The latitude range is found by binary search on the latitude-sorted
+        columns; only that slice is checked against the longitude range.
+
+        Args:
+            north, south, east, west: Validated box edges, as for within_bounds()
+
+        Returns:
+            Elements inside the box, in their original order
+        """
+        positions, lons, lats = self._coordinate_columns()
+        band = slice(
+            int(np.searchsorted(lats, south, side="left")),
+            int(np.searchsorted(lats, north, side="right")),
+        )
+        positions, lons = positions[band], lons[band]
+        if west <= east:
+            in_range = (lons >= west) & (lons <= east)
+        else:  # Crosses 180° meridian
+            in_range = (lons >= west) | (lons <= east)
+        selected = np.sort(positions[in_range])
+        return [self._elements[i] for i in selected.tolist()]
+
+    def _coordinate_columns(
+        self,
+    ) -> Tuple["NDArray[np.intp]", "NDArray[np.float64]", "NDArray[np.float64]"]:
+        """
+        Build (or fetch from cache) the coordinates of elements as NumPy arrays.
+
+        Elements without coordinates, or whose coordinates cannot be read, are
+        left out, matching the per-element path in near(). The arrays are sorted
+        by latitude.
+
+        The arrays are kept with a snapshot of every element's coordinates and
+        reused only while the current coordinates compare equal to it. Only
+        immutable Coordinate values (or None) are snapshotted; if any element
+        holds something else the arrays are rebuilt on every call.
+
+        Returns:
+            Tuple of (element positions, longitudes, latitudes) arrays
+        """
+        coordinate_type = _coordinate_types()[1]
+        snapshot: Optional[List[Any]]
         try:
-            field_value = self._get_field_value(element, field_name)
-        except AttributeError:
-            return False
+            snapshot = [getattr(element, "coordinates", None) for element in self._elements]
+        except (ValueError, TypeError):
+            snapshot = None
+        if snapshot is not None and not set(map(type, snapshot)) <= {coordinate_type, type(None)}:
+            snapshot = None
+
+        cached = self._coordinate_cache
+        # List comparison checks identity first and runs in C
+        if cached is not None and snapshot is not None and cached[0] == snapshot:
+            columns: Tuple["NDArray[np.intp]", "NDArray[np.float64]", "NDArray[np.float64]"] = (
+                cached[1]
+            )
+            return columns
 
-        # Apply lookup type
-        return self._apply_lookup(field_value, lookup_type, value)
+        positions = []
+        lons = []
+        lats = []
+        for i, element in enumerate(self._elements):
+            try:
+                coords = self._point_coords(element)
+            except (ValueError, TypeError):
+                continue
+            if coords:
+                positions.append(i)
+                lons.append(coords.longitude)
+                lats.append(coords.latitude)
+        lat_array = np.array(lats, dtype=np.float64)
+        order = np.argsort(lat_array, kind="stable")
+        columns = (
+            np.array(positions, dtype=np.intp)[order],
+            np.array(lons, dtype=np.float64)[order],
+            lat_array[order],
+        )
+        self._coordinate_cache = None if snapshot is None else (snapshot, columns)
+        return columns
+
+    def _matches_filters(self, element: T, lookups: List[_ParsedLookup]) -> bool:
+        """
+        Check if an element matches all the given filters.
+
+        Args:
+            element: KML element to check
+            lookups: Parsed field lookups from _parse_lookups()
+
+        Returns:
+            True if element matches all filters. Elements missing a filtered
+            field never match.
+        """
+        for field_name, lookup_type, value in lookups:
+            try:
+                field_value = self._get_field_value(element, field_name)
+            except AttributeError:
+                return False
+            if not self._apply_lookup(field_value, lookup_type, value):
+                return False
+        return True
 
     def _get_field_value(self, element: T, field_path: str) -> Any:
         """
@@ -644,16 +1602,7 @@ class KMLQuerySet(Generic[T]):
         Raises:
             AttributeError: If field doesn't exist
         """
-        parts = field_path.split(".")
-        current = element
-
-        for part in parts:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                raise AttributeError(f"'{element.__class__.__name__}' has no attribute '{part}'")
-
-        return current
+        return attrgetter(field_path)(element)
 
     def _apply_lookup(self, field_value: Any, lookup_type: str, filter_value: Any) -> bool:
         """
@@ -667,51 +1616,13 @@ class KMLQuerySet(Generic[T]):
         Returns:
             True if lookup matches
         """
-        # pylint: disable=too-many-return-statements, too-many-branches, too-many-public-methods
         if field_value is None:
             return lookup_type == "isnull" and filter_value
 
-        # String lookups
-        if lookup_type == "exact":
-            return bool(field_value == filter_value)
-        if lookup_type == "iexact":
-            return str(field_value).lower() == str(filter_value).lower()
-        if lookup_type == "contains":
-            return str(filter_value) in str(field_value)
-        if lookup_type == "icontains":
-            return str(filter_value).lower() in str(field_value).lower()
-        if lookup_type == "startswith":
-            return str(field_value).startswith(str(filter_value))
-        if lookup_type == "istartswith":
-            return str(field_value).lower().startswith(str(filter_value).lower())
-        if lookup_type == "endswith":
-            return str(field_value).endswith(str(filter_value))
-        if lookup_type == "iendswith":
-            return str(field_value).lower().endswith(str(filter_value).lower())
-        if lookup_type == "regex":
-            return bool(re.search(str(filter_value), str(field_value)))
-        if lookup_type == "iregex":
-            return bool(re.search(str(filter_value), str(field_value), re.IGNORECASE))
-
-        # Comparison lookups
-        if lookup_type == "gt":
-            return bool(field_value > filter_value)
-        if lookup_type == "gte":
-            return bool(field_value >= filter_value)
-        if lookup_type == "lt":
-            return bool(field_value < filter_value)
-        if lookup_type == "lte":
-            return bool(field_value <= filter_value)
-
-        # Range and membership lookups
-        if lookup_type == "in":
-            return bool(field_value in filter_value)
-        if lookup_type == "range":
-            return bool(filter_value[0] <= field_value <= filter_value[1])
-        if lookup_type == "isnull":
-            return bool((field_value is None) == filter_value)
-
-        raise KMLQueryError(f"Unsupported lookup type: {lookup_type}")
+        lookup_fn = _LOOKUPS.get(lookup_type)
+        if lookup_fn is None:
+            raise KMLQueryError(f"Unsupported lookup type: {lookup_type}")
+        return lookup_fn(field_value, filter_value)
 
     def _point_coords(self, element: T) -> Optional["Coordinate"]:
         """
@@ -723,13 +1634,10 @@ class KMLQuerySet(Generic[T]):
         Returns:
             Coordinate instance or None if no valid coordinates found
         """
-        from ..models.point import (  # pylint: disable=import-outside-toplevel
-            Point as _Point,
-            Coordinate,
-        )
+        point_type, coordinate_type = _coordinate_types()
 
         # For Point objects, get coordinates directly
-        if isinstance(element, _Point):
+        if isinstance(element, point_type):
             return element.coordinates
 
         # For other elements, try to find standard coordinates attribute
@@ -737,9 +1645,11 @@ class KMLQuerySet(Generic[T]):
 
         if not coords:
             return None
+        if type(coords) is coordinate_type:  # pylint: disable=unidiomatic-typecheck
+            return coords
 
         try:
-            return Coordinate.from_any(coords)
+            return coordinate_type.from_any(coords)
         except (ValueError, TypeError) as e:
             # Log warning for invalid coordinates but don't raise
             logger = logging.getLogger(__name__)
@@ -43,6 +43,19 @@ class KMLElement(ABC, metaclass=KMLElementMeta):
     the Django-style ORM interface pattern.
     """
 
+    # Common attributes live in slots for cheaper access and smaller instances.
+    # __dict__ is kept for subclass fields and the extra attributes __init__ accepts.
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "visibility",
+        "_parent",
+        "_kml_element",
+        "__dict__",
+        "__weakref__",
+    )
+
     # Class-level manager (will be set by metaclass)
     objects: "KMLManager"
 
@@ -161,6 +174,10 @@ class KMLElement(ABC, metaclass=KMLElementMeta):
         """
         # Get all attributes except private ones and parent
         attrs = {}
+        for cls in type(self).__mro__:
+            for key in cls.__dict__.get("__slots__", ()):
+                if not key.startswith("_") and hasattr(self, key):
+                    attrs[key] = getattr(self, key)
         for key, value in self.__dict__.items():
             if not key.startswith("_"):
                 attrs[key] = value
@@ -6,14 +6,16 @@ with coordinates and extended attributes from KML files.
 """
 
 # pylint: disable=too-many-arguments, too-many-positional-arguments
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union, overload
 
 from kmlorm.core.managers import PlacemarkManager
 from .base import KMLElement
 from .point import Coordinate, Point
 
-
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from .multigeometry import MultiGeometry
     from ..spatial.calculations import DistanceUnit
 
@@ -27,6 +29,18 @@ class Placemark(KMLElement):
     addresses, phone numbers, and extended data.
     """
 
+    # Placemark fields are slotted like the KMLElement ones; __dict__ from the base
+    # class still takes any extra attributes
+    __slots__ = (
+        "point",
+        "multigeometry",
+        "address",
+        "phone_number",
+        "snippet",
+        "style_url",
+        "extended_data",
+    )
+
     objects: PlacemarkManager = PlacemarkManager()
     point: Optional["Point"]
     multigeometry: Optional["MultiGeometry"]
@@ -160,20 +174,34 @@ class Placemark(KMLElement):
             return self.point.coordinates
         return None
 
+    @overload
+    def distance_to(
+        self, other: "NDArray[Any]", unit: Optional["DistanceUnit"] = None
+    ) -> Optional["NDArray[np.float64]"]: ...
+
+    @overload
     def distance_to(
         self,
         other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list],
         unit: Optional["DistanceUnit"] = None,
-    ) -> Optional[float]:
+    ) -> Optional[float]: ...
+
+    def distance_to(
+        self,
+        other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list, "NDArray[Any]"],
+        unit: Optional["DistanceUnit"] = None,
+    ) -> Union[Optional[float], "NDArray[np.float64]"]:
         """
         Calculate distance to another spatial object.
 
         Args:
-            other: Target object with coordinates (Coordinate, Point, Placemark, or tuple/list)
+            other: Target object with coordinates (Coordinate, Point, Placemark, or tuple/list),
+                or a NumPy array of shape (N, 2) holding (longitude, latitude) rows
             unit: Distance unit (defaults to kilometers)
 
         Returns:
-            Distance in specified units, or None if this placemark or target has no coordinates
+            Distance in specified units, or None if this placemark or target has no coordinates.
+            For array targets, an array of N distances computed in a single vectorized pass.
 
         Examples:
             >>> placemark1 = Placemark(name="NYC", coordinates=(-74.006, 40.7128))
@@ -191,6 +219,11 @@ class Placemark(KMLElement):
             >>> coord = Coordinate(longitude=1, latitude=1)
             >>> distance_to_point = placemark1.distance_to(point)
             >>> distance_to_coord = placemark1.distance_to(coord)
+
+            >>> # Batch of targets as a NumPy (lon, lat) array (requires numpy)
+            >>> import numpy as np
+            >>> targets = np.array([[-0.1276, 51.5074], [2.3522, 48.8566]])
+            >>> distances = placemark1.distance_to(targets)
         """
         if not self.has_coordinates:
             return None
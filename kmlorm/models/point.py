@@ -7,16 +7,19 @@ Placemarks that contain Point geometries.
 """
 
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple, Union, TYPE_CHECKING, cast
+from typing import Any, Optional, Tuple, Union, TYPE_CHECKING, cast, overload
 from ..core.exceptions import KMLValidationError
 from .base import KMLElement
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
     from ..spatial.calculations import DistanceUnit
     from .placemark import Placemark
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coordinate:
     """
     Represents a geographic coordinate with longitude, latitude, and optional altitude.
@@ -72,9 +75,8 @@ class Coordinate:
                 "Invalid coordinate tuple.  Expected (lon, lat, [alt])"
                 f"with numeric arguments.  Got ({t}]"
             ) from exc
-        rv = cls(longitude=lon, latitude=lat, altitude=alt)
-        rv.validate()
-        return rv
+        # __post_init__ validates the ranges
+        return cls(longitude=lon, latitude=lat, altitude=alt)
 
     @classmethod
     def from_string(cls, s: str) -> "Coordinate":
@@ -179,20 +181,34 @@ class Coordinate:
         """
         return self
 
+    @overload
+    def distance_to(
+        self, other: "NDArray[Any]", unit: Optional["DistanceUnit"] = None
+    ) -> "NDArray[np.float64]": ...
+
+    @overload
     def distance_to(
         self,
         other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list],
         unit: Optional["DistanceUnit"] = None,
-    ) -> Optional[float]:
+    ) -> Optional[float]: ...
+
+    def distance_to(
+        self,
+        other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list, "NDArray[Any]"],
+        unit: Optional["DistanceUnit"] = None,
+    ) -> Union[Optional[float], "NDArray[np.float64]"]:
         """
         Calculate distance to another spatial object.
 
         Args:
-            other: Target object with coordinates (Coordinate, Point, Placemark, or tuple)
+            other: Target object with coordinates (Coordinate, Point, Placemark, or tuple),
+                or a NumPy array of shape (N, 2) holding (longitude, latitude) rows
             unit: Distance unit (defaults to kilometers)
 
         Returns:
-            Distance in specified units, or None if target has no coordinates
+            Distance in specified units, or None if target has no coordinates.
+            For array targets, an array of N distances.
 
         Examples:
             >>> coord1 = Coordinate(longitude=-74.006, latitude=40.7128)  # NYC
@@ -203,13 +219,20 @@ class Coordinate:
             >>> # Different units
             >>> from kmlorm.spatial import DistanceUnit
             >>> distance_miles = coord1.distance_to(coord2, unit=DistanceUnit.MILES)
+
+            >>> # Many targets at once (requires numpy)
+            >>> import numpy as np
+            >>> distances = coord1.distance_to(np.array([[-0.1276, 51.5074], [2.3522, 48.8566]]))
         """
         # pylint: disable=import-outside-toplevel
         from ..spatial.calculations import SpatialCalculations, DistanceUnit
+        from ..spatial.vectorized import distances_to_array, is_coordinate_array
 
         if unit is None:
             unit = DistanceUnit.KILOMETERS
-        result = SpatialCalculations.distance_between(self, other, unit)
+        if is_coordinate_array(other):
+            return distances_to_array(self, cast("NDArray[Any]", other), unit)
+        result = SpatialCalculations.distance_between(self, cast(Any, other), unit)
         return cast(Optional[float], result)
 
     def bearing_to(
@@ -288,15 +311,21 @@ class Point(KMLElement):
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a Point with coordinates and properties."""
+        # Geometry properties are taken out first so the base class does not set
+        # (and parse) them only for them to be set again below
+        coordinates = kwargs.pop("coordinates", None)
+        extrude = kwargs.pop("extrude", False)
+        altitude_mode = kwargs.pop("altitude_mode", "clampToGround")
+        tessellate = kwargs.pop("tessellate", False)
         super().__init__(**kwargs)
 
         # Geometry properties
         self._coordinates: Optional["Coordinate"] = None
-        if "coordinates" in kwargs and kwargs["coordinates"] is not None:
-            self.coordinates = kwargs["coordinates"]
-        self.extrude: bool = kwargs.get("extrude", False)
-        self.altitude_mode: str = kwargs.get("altitude_mode", "clampToGround")
-        self.tessellate: bool = kwargs.get("tessellate", False)
+        if coordinates is not None:
+            self.coordinates = coordinates
+        self.extrude: bool = extrude
+        self.altitude_mode: str = altitude_mode
+        self.tessellate: bool = tessellate
 
     @property
     def coordinates(self) -> Optional["Coordinate"]:
@@ -403,20 +432,33 @@ class Point(KMLElement):
         """
         return self.coordinates
 
+    @overload
+    def distance_to(
+        self, other: "NDArray[Any]", unit: Optional["DistanceUnit"] = None
+    ) -> Optional["NDArray[np.float64]"]: ...
+
+    @overload
     def distance_to(
         self,
         other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list],
         unit: Optional["DistanceUnit"] = None,
-    ) -> Optional[float]:
+    ) -> Optional[float]: ...
+
+    def distance_to(
+        self,
+        other: Union["Coordinate", "Point", "Placemark", Tuple[float, float], list, "NDArray[Any]"],
+        unit: Optional["DistanceUnit"] = None,
+    ) -> Union[Optional[float], "NDArray[np.float64]"]:
         """
         Calculate distance to another spatial object.
 
         Args:
-            other: Target object with coordinates
+            other: Target object with coordinates, or a NumPy array of (longitude, latitude) rows
             unit: Distance unit (defaults to kilometers)
 
         Returns:
-            Distance in specified units, or None if this point or target has no coordinates
+            Distance in specified units (an array of distances for array targets),
+            or None if this point or target has no coordinates
 
         Examples:
             >>> point1 = Point(coordinates=(0, 0))
@@ -207,16 +207,30 @@ class KMLFile:
         Args:
             elements: List of parsed KML element objects
         """
+        # Group by manager so each one gets a single batched add()
+        placemarks: List[Placemark] = []
+        folders: List[Folder] = []
+        paths: List[Path] = []
+        polygons: List[Polygon] = []
+        points: List[Point] = []
+        multigeometries: List[MultiGeometry] = []
         for element in elements:
             if isinstance(element, Placemark):
-                self.placemarks.add(element)
+                placemarks.append(element)
             elif isinstance(element, Folder):
-                self.folders.add(element)
+                folders.append(element)
             elif isinstance(element, Path):
-                self.paths.add(element)
+                paths.append(element)
             elif isinstance(element, Polygon):
-                self.polygons.add(element)
+                polygons.append(element)
             elif isinstance(element, Point):
-                self.points.add(element)
+                points.append(element)
             elif isinstance(element, MultiGeometry):
-                self.multigeometries.add(element)
+                multigeometries.append(element)
+
+        self.placemarks.add(*placemarks)
+        self.folders.add(*folders)
+        self.paths.add(*paths)
+        self.polygons.add(*polygons)
+        self.points.add(*points)
+        self.multigeometries.add(*multigeometries)
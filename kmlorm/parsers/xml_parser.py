@@ -10,9 +10,10 @@ contain unescaped XML entities, ensuring compatibility with real-world
 KML exports while maintaining strict validation for well-formed files.
 """
 
-# pylint: disable= too-many-branches, import-outside-toplevel, too-many-lines
+# pylint: disable= too-many-branches, import-outside-toplevel, too-many-lines, too-many-locals
 import logging
 import os
+import sys
 import xml.etree.ElementTree as _et
 
 import zipfile
@@ -355,13 +356,13 @@ class XMLKMLParser:
             # Extract basic attributes
             placemark_data = {
                 "id": elem.get("id"),
-                "name": self._get_text(elem, "kml:name"),
+                "name": self._get_interned_text(elem, "kml:name"),
                 "description": self._get_text(elem, "kml:description"),
                 "visibility": self._get_bool(elem, "kml:visibility", default=True),
                 "address": self._get_text(elem, "kml:address"),
                 "phone_number": self._get_text(elem, "kml:phoneNumber"),
                 "snippet": self._get_text(elem, "kml:Snippet"),
-                "style_url": self._get_text(elem, "kml:styleUrl"),
+                "style_url": self._get_interned_text(elem, "kml:styleUrl"),
             }
 
             # Create Point object from geometry if provided (direct child Points only)
@@ -384,7 +385,7 @@ class XMLKMLParser:
                             description=placemark_data["description"],
                             coordinates=point_coords,
                             extrude=self._get_bool(point_elem, "kml:extrude", default=False),
-                            altitude_mode=self._get_text(
+                            altitude_mode=self._get_interned_text(
                                 point_elem, "kml:altitudeMode", default="clampToGround"
                             ),
                             tessellate=self._get_bool(point_elem, "kml:tessellate", default=False),
@@ -426,13 +427,13 @@ class XMLKMLParser:
             # Extract basic attributes
             placemark_data = {
                 "id": elem.get("id"),
-                "name": self._get_text(elem, "kml:name"),
+                "name": self._get_interned_text(elem, "kml:name"),
                 "description": self._get_text(elem, "kml:description"),
                 "visibility": self._get_bool(elem, "kml:visibility", default=True),
                 "address": self._get_text(elem, "kml:address"),
                 "phone_number": self._get_text(elem, "kml:phoneNumber"),
                 "snippet": self._get_text(elem, "kml:Snippet"),
-                "style_url": self._get_text(elem, "kml:styleUrl"),
+                "style_url": self._get_interned_text(elem, "kml:styleUrl"),
                 "multigeometry": multigeometry,
             }
 
@@ -467,7 +468,7 @@ class XMLKMLParser:
         try:
             folder_data = {
                 "id": elem.get("id"),
-                "name": self._get_text(elem, "kml:name"),
+                "name": self._get_interned_text(elem, "kml:name"),
                 "description": self._get_text(elem, "kml:description"),
                 "visibility": self._get_bool(elem, "kml:visibility", default=True),
             }
@@ -500,6 +501,13 @@ class XMLKMLParser:
             elem: XML element containing child elements
         """
 
+        # Collect children per manager and add each batch once at the end
+        placemarks: List[Placemark] = []
+        folders: List[Folder] = []
+        paths: List[Path] = []
+        polygons: List[Polygon] = []
+        points: List[Point] = []
+
         # Parse direct child elements only (not all descendants)
         for child_elem in elem:
             # Skip non-element nodes
@@ -511,49 +519,52 @@ class XMLKMLParser:
                 geometry_objects = self._create_placemark_with_geometry(child_elem)
                 for obj in geometry_objects:
                     if isinstance(obj, Placemark):
-                        folder.placemarks.add(obj)
+                        placemarks.append(obj)
                     elif isinstance(obj, Path):
-                        folder.paths.add(obj)
+                        paths.append(obj)
                     elif isinstance(obj, Polygon):
-                        folder.polygons.add(obj)
+                        polygons.append(obj)
                     elif isinstance(obj, Point):
-                        folder.points.add(obj)
+                        points.append(obj)
 
             elif child_elem.tag.endswith("}Folder") or child_elem.tag == "Folder":
                 # Create nested folder and add to parent folder
                 nested_folder = self._create_folder(child_elem)
                 if nested_folder:
-                    folder.folders.add(nested_folder)
+                    folders.append(nested_folder)
 
             elif child_elem.tag.endswith("}LineString") or child_elem.tag == "LineString":
                 # Standalone LineString (not in Placemark)
                 path = self._create_path_from_linestring(child_elem)
                 if path:
-                    folder.paths.add(path)
+                    paths.append(path)
 
             elif child_elem.tag.endswith("}Polygon") or child_elem.tag == "Polygon":
                 # Standalone Polygon (not in Placemark)
                 polygon = self._create_polygon_from_element(child_elem)
                 if polygon:
-                    folder.polygons.add(polygon)
+                    polygons.append(polygon)
 
             elif child_elem.tag.endswith("}Point") or child_elem.tag == "Point":
                 # Standalone Point (not in Placemark)
                 point = self._create_point_from_element(child_elem)
                 if point:
-                    folder.points.add(point)
+                    points.append(point)
 
             elif child_elem.tag.endswith("}MultiGeometry") or child_elem.tag == "MultiGeometry":
                 # Standalone MultiGeometry (not in Placemark)
                 multigeom = self._create_multigeometry_from_element(child_elem)
                 if multigeom:
                     # Add the MultiGeometry's contained geometries to the folder
-                    for point in multigeom.get_points():
-                        folder.points.add(point)
-                    for path in multigeom.get_paths():
-                        folder.paths.add(path)
-                    for polygon in multigeom.get_polygons():
-                        folder.polygons.add(polygon)
+                    points.extend(multigeom.get_points())
+                    paths.extend(multigeom.get_paths())
+                    polygons.extend(multigeom.get_polygons())
+
+        folder.placemarks.add(*placemarks)
+        folder.folders.add(*folders)
+        folder.paths.add(*paths)
+        folder.polygons.add(*polygons)
+        folder.points.add(*points)
 
     def _create_path_from_placemark(
         self, placemark_elem: Any, linestring_elem: Any
@@ -577,11 +588,11 @@ class XMLKMLParser:
 
             path_data = {
                 "id": placemark_elem.get("id"),
-                "name": self._get_text(placemark_elem, "kml:name"),
+                "name": self._get_interned_text(placemark_elem, "kml:name"),
                 "description": self._get_text(placemark_elem, "kml:description"),
                 "coordinates": self._parse_coordinate_string(coordinates_raw),
                 "tessellate": self._get_bool(linestring_elem, "kml:tessellate", default=False),
-                "altitude_mode": self._get_text(
+                "altitude_mode": self._get_interned_text(
                     linestring_elem, "kml:altitudeMode", default="clampToGround"
                 ),
             }
@@ -632,12 +643,12 @@ class XMLKMLParser:
 
             polygon_data = {
                 "id": placemark_elem.get("id"),
-                "name": self._get_text(placemark_elem, "kml:name"),
+                "name": self._get_interned_text(placemark_elem, "kml:name"),
                 "description": self._get_text(placemark_elem, "kml:description"),
                 "outer_boundary": self._parse_coordinate_string(outer_coords),
                 "inner_boundaries": inner_boundaries,
                 "extrude": self._get_bool(polygon_elem, "kml:extrude", default=False),
-                "altitude_mode": self._get_text(
+                "altitude_mode": self._get_interned_text(
                     polygon_elem, "kml:altitudeMode", default="clampToGround"
                 ),
             }
@@ -672,7 +683,7 @@ class XMLKMLParser:
             if parent is not None and (
                 parent.tag.endswith("}Placemark") or parent.tag == "Placemark"
             ):
-                name = self._get_text(parent, "kml:name")
+                name = self._get_interned_text(parent, "kml:name")
                 description = self._get_text(parent, "kml:description")
                 placemark_id = parent.get("id")
             else:
@@ -692,7 +703,9 @@ class XMLKMLParser:
                 "description": description,
                 "coordinates": self._parse_coordinate_string(coordinates_raw),
                 "tessellate": self._get_bool(elem, "kml:tessellate", default=False),
-                "altitude_mode": self._get_text(elem, "kml:altitudeMode", default="clampToGround"),
+                "altitude_mode": self._get_interned_text(
+                    elem, "kml:altitudeMode", default="clampToGround"
+                ),
             }
 
             return Path(**path_data)
@@ -721,7 +734,7 @@ class XMLKMLParser:
             if parent is not None and (
                 parent.tag.endswith("}Placemark") or parent.tag == "Placemark"
             ):
-                name = self._get_text(parent, "kml:name")
+                name = self._get_interned_text(parent, "kml:name")
                 description = self._get_text(parent, "kml:description")
                 placemark_id = parent.get("id")
             else:
@@ -752,7 +765,9 @@ class XMLKMLParser:
                 "outer_boundary": self._parse_coordinate_string(outer_coords),
                 "inner_boundaries": inner_boundaries,
                 "extrude": self._get_bool(elem, "kml:extrude", default=False),
-                "altitude_mode": self._get_text(elem, "kml:altitudeMode", default="clampToGround"),
+                "altitude_mode": self._get_interned_text(
+                    elem, "kml:altitudeMode", default="clampToGround"
+                ),
             }
 
             return Polygon(**polygon_data)
@@ -783,7 +798,7 @@ class XMLKMLParser:
             if parent is not None and (
                 parent.tag.endswith("}Placemark") or parent.tag == "Placemark"
             ):
-                name = self._get_text(parent, "kml:name")
+                name = self._get_interned_text(parent, "kml:name")
                 description = self._get_text(parent, "kml:description")
                 point_id = parent.get("id")
             else:
@@ -808,7 +823,9 @@ class XMLKMLParser:
                 "description": description,
                 "coordinates": coordinates,
                 "extrude": self._get_bool(elem, "kml:extrude", default=False),
-                "altitude_mode": self._get_text(elem, "kml:altitudeMode", default="clampToGround"),
+                "altitude_mode": self._get_interned_text(
+                    elem, "kml:altitudeMode", default="clampToGround"
+                ),
                 "tessellate": self._get_bool(elem, "kml:tessellate", default=False),
             }
 
@@ -838,7 +855,7 @@ class XMLKMLParser:
             if parent is not None and (
                 parent.tag.endswith("}Placemark") or parent.tag == "Placemark"
             ):
-                name = self._get_text(parent, "kml:name")
+                name = self._get_interned_text(parent, "kml:name")
                 description = self._get_text(parent, "kml:description")
                 multigeom_id = parent.get("id")
             else:
@@ -964,6 +981,20 @@ class XMLKMLParser:
             return str(elem.text).strip()
         return default
 
+    def _get_interned_text(
+        self, parent: Any, xpath: str, default: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get text content from child element as an interned string.
+
+        Used for short values that repeat across a document (names, style URLs,
+        altitude modes) so equal values share one string object. That saves memory
+        and lets set/dict lookups and ``==`` comparisons short-circuit on identity.
+        Free text such as descriptions is left alone.
+        """
+        text = self._get_text(parent, xpath, default)
+        return sys.intern(text) if text is not None else None
+
     def _get_bool(self, parent: Any, xpath: str, default: bool = False) -> bool:
         """Get boolean value from child element."""
         text = self._get_text(parent, xpath)
@@ -529,6 +529,44 @@ class SpatialCalculations:
 
         return min_lon, min_lat, max_lon, max_lat
 
+    @classmethod
+    def radius_bounds(
+        cls, latitude: float, radius_km: float
+    ) -> Tuple[float, float, Optional[float]]:
+        """
+        Calculate a latitude band and longitude half-width enclosing a circle.
+
+        Every point whose Haversine distance from a center at ``latitude`` is at
+        most ``radius_km`` lies inside the returned bounds, so they can be used
+        to discard far-away points before computing exact distances. The bounds
+        are widened slightly to absorb floating point error.
+
+        Args:
+            latitude: Latitude of the circle center in decimal degrees
+            radius_km: Circle radius in kilometers
+
+        Returns:
+            Tuple of (min_lat, max_lat, max_lon_offset). ``max_lon_offset`` is the
+            largest longitude difference from the center (wrapped to [0, 180])
+            of a point inside the circle, or None if the circle reaches a pole
+            and longitude cannot be bounded.
+
+        Examples:
+            >>> min_lat, max_lat, max_lon_offset = SpatialCalculations.radius_bounds(39.3, 50.0)
+        """
+        # Angular radius, widened by a relative and absolute epsilon
+        angle = max(radius_km, 0.0) / EARTH_RADIUS_MEAN_KM * (1 + 1e-9) + 1e-12
+        angle_deg = angle * RADIANS_TO_DEGREES
+        min_lat = latitude - angle_deg
+        max_lat = latitude + angle_deg
+        if min_lat <= -90.0 or max_lat >= 90.0:
+            return max(min_lat, -90.0), min(max_lat, 90.0), None
+
+        sin_offset = math.sin(angle) / math.cos(latitude * DEGREES_TO_RADIANS)
+        if sin_offset >= 1.0:
+            return min_lat, max_lat, None
+        return min_lat, max_lat, math.asin(sin_offset) * RADIANS_TO_DEGREES * (1 + 1e-9) + 1e-9
+
     @classmethod
     @log_spatial_operation
     def interpolate(
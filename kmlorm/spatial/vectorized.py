@@ -0,0 +1,125 @@
+"""
+Vectorized spatial calculations backed by NumPy.
+
+This module provides bulk counterparts of the scalar routines in
+:mod:`kmlorm.spatial.calculations`. Instead of calling the Haversine formula
+once per target in a Python loop, the target coordinates are held in
+contiguous float64 arrays and processed with NumPy ufuncs in a single pass.
+
+NumPy is an optional dependency. Check ``HAS_NUMPY`` before using anything in
+this module; the public functions raise ``ImportError`` when it is missing.
+
+Examples:
+    >>> import numpy as np
+    >>> from kmlorm.models.point import Coordinate
+    >>> origin = Coordinate(longitude=0.0, latitude=0.0)
+    >>> targets = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]])  # (lon, lat) rows
+    >>> distances = origin.distance_to(targets)  # np.ndarray of kilometers
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from .calculations import DistanceUnit
+from .constants import DEGREES_TO_RADIANS, EARTH_RADIUS_MEAN_KM
+from .exceptions import InvalidCoordinateError
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ..models.point import Coordinate
+
+
+def _require_numpy() -> None:
+    """Raise ImportError if NumPy is not installed."""
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for vectorized spatial calculations")
+
+
+def is_coordinate_array(value: Any) -> bool:
+    """
+    Check whether a value should be routed to the vectorized code path.
+
+    Args:
+        value: Any spatial input (Coordinate, tuple, array, ...)
+
+    Returns:
+        True if NumPy is available and ``value`` is an ``np.ndarray``
+    """
+    return HAS_NUMPY and isinstance(value, np.ndarray)
+
+
+def haversine_distances(
+    lat: float, lon: float, lats: "NDArray[np.float64]", lons: "NDArray[np.float64]"
+) -> "NDArray[np.float64]":
+    """
+    Calculate great circle distances from one point to many using NumPy.
+
+    Uses the same Haversine formulation and Earth radius as
+    ``SpatialCalculations._haversine_distance`` so results match the scalar
+    path to floating point precision.
+
+    Args:
+        lat, lon: Origin coordinates in decimal degrees
+        lats, lons: Target coordinates in decimal degrees (equal-length 1-D arrays)
+
+    Returns:
+        Array of distances in kilometers
+    """
+    _require_numpy()
+    lat1_r = lat * DEGREES_TO_RADIANS
+    lon1_r = lon * DEGREES_TO_RADIANS
+    lats_r = np.asarray(lats, dtype=np.float64) * DEGREES_TO_RADIANS
+    lons_r = np.asarray(lons, dtype=np.float64) * DEGREES_TO_RADIANS
+
+    a = (
+        np.sin((lats_r - lat1_r) / 2) ** 2
+        + np.cos(lat1_r) * np.cos(lats_r) * np.sin((lons_r - lon1_r) / 2) ** 2
+    )
+    distances: "NDArray[np.float64]" = EARTH_RADIUS_MEAN_KM * 2 * np.arcsin(np.sqrt(a))
+    return distances
+
+
+def distances_to_array(
+    origin: "Coordinate",
+    targets: "NDArray[Any]",
+    unit: DistanceUnit = DistanceUnit.KILOMETERS,
+) -> "NDArray[np.float64]":
+    """
+    Calculate distances from a coordinate to an array of (lon, lat) rows.
+
+    Args:
+        origin: Source coordinate
+        targets: Array of shape (N, 2) or (N, 3) in KML order (longitude, latitude[, altitude])
+        unit: Unit for distance measurements
+
+    Returns:
+        Array of N distances in the requested unit
+
+    Raises:
+        InvalidCoordinateError: If ``targets`` does not have shape (N, 2) or (N, 3),
+            or a longitude or latitude is out of range (NaN included), as the
+            scalar path rejects it
+    """
+    _require_numpy()
+    if targets.ndim != 2 or targets.shape[1] not in (2, 3):
+        raise InvalidCoordinateError(
+            f"Invalid coordinate array shape {targets.shape}. Expected (N, 2) or (N, 3)"
+        )
+    lon_ok = np.abs(targets[:, 0]) <= 180
+    if not lon_ok.all():
+        lon = float(targets[np.argmin(lon_ok), 0])
+        raise InvalidCoordinateError(f"Invalid longitude: {lon}.  Must be between -180.0 and 180.0")
+    lat_ok = np.abs(targets[:, 1]) <= 90
+    if not lat_ok.all():
+        lat = float(targets[np.argmin(lat_ok), 1])
+        raise InvalidCoordinateError(f"Invalid latitude: {lat}. Must be between -90.0 and 90.0")
+    km = haversine_distances(origin.latitude, origin.longitude, targets[:, 1], targets[:, 0])
+    result: "NDArray[np.float64]" = km * unit.value
+    return result
@@ -114,6 +114,18 @@ class TestBase:
         # extra attribute should be copied
         assert getattr(copy, "extra") == 123
 
+    def test_common_fields_use_slots_and_extras_use_dict(self) -> None:
+        """
+        Tests that the common fields are stored in slots while extra keyword
+        attributes still go to the instance __dict__.
+        """
+        element = _TestElement(element_id="e", name="Slotted", extra=1)
+
+        assert "name" in KMLElement.__slots__
+        assert "name" not in element.__dict__
+        assert element.__dict__ == {"extra": 1}
+        assert element.copy().name == "Slotted"
+
     def test_update_success_and_missing_attribute_raises(self) -> None:
         """
         Tests the `update` method of `_TestElement` for correct attribute updating and error
@@ -20,9 +20,14 @@ Dependencies:
 """
 
 # pylint: disable=duplicate-code
+from typing import Any
+
 import pytest
 
+from kmlorm.core.exceptions import KMLInvalidCoordinates, KMLValidationError
 from kmlorm.core.managers import KMLManager
+from kmlorm.core.querysets import COORDINATE_ARRAYS_MIN_ELEMENTS, KMLQuerySet
+from kmlorm.models.base import KMLElement
 from kmlorm.models.point import Point
 from kmlorm.models.folder import Folder
 
@@ -182,7 +187,6 @@ class TestManagersExtra:
         The test uses two Point instances with different ids and ranks to check
             the correctness of each method.
         """
-        from ..models.base import KMLElement  # pylint: disable=import-outside-toplevel
 
         mgr = PointManager()
         p1 = Point(id="p1", coordinates=(0.0, 0.0), rank=2)
@@ -243,6 +247,69 @@ class TestManagersExtra:
         assert mgr.has_coordinates().elements == [p]
         assert mgr.valid_coordinates().elements == [p]
 
+    def test_spatial_queries_reuse_coordinate_index_until_changed(self) -> None:
+        """
+        Tests that repeated near()/within_bounds() calls on a large manager build
+        the coordinate index once, and that adding an element or moving one is
+        seen by the next query.
+        """
+        pytest.importorskip("numpy")
+        mgr = PointManager()
+        mgr.add(
+            *[
+                Point(id=f"p{i}", coordinates=(i % 360 - 180.0, i % 170 - 85.0))
+                for i in range(COORDINATE_ARRAYS_MIN_ELEMENTS)
+            ]
+        )
+        count = len(mgr.elements)
+        reads = 0
+        original = KMLQuerySet._point_coords  # pylint: disable=protected-access
+
+        def counted(qs: KMLQuerySet, element: Any) -> Any:
+            nonlocal reads
+            reads += 1
+            return original(qs, element)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(KMLQuerySet, "_point_coords", counted)
+            assert mgr.near(0.5, 0.5, radius_km=50).elements == []
+            assert mgr.within_bounds(north=1, south=0, east=1, west=0).elements == []
+            assert reads == count
+
+            mgr.elements[0].coordinates = (0.5, 0.5)
+            assert mgr.near(0.5, 0.5, radius_km=50).elements == [mgr.elements[0]]
+            assert reads == 2 * count
+
+            extra = Point(id="extra", coordinates=(0.6, 0.6))
+            mgr.add(extra)
+            assert mgr.within_bounds(north=1, south=0, east=1, west=0).elements == [
+                mgr.elements[0],
+                extra,
+            ]
+            assert reads == 3 * count + 1
+
+    def test_spatial_queries_validate_before_reading_elements(self) -> None:
+        """
+        Tests that near() and within_bounds() on a large manager reject invalid
+        arguments before any element's coordinates are read.
+        """
+
+        class _Unreadable(KMLElement):
+            @property
+            def coordinates(self) -> Any:
+                """Fail the test if the manager reads the element."""
+                raise AssertionError("element coordinates were read")
+
+        mgr: KMLManager[Any] = KMLManager()
+        mgr.add(*[_Unreadable(element_id=str(i)) for i in range(COORDINATE_ARRAYS_MIN_ELEMENTS)])
+
+        with pytest.raises(KMLValidationError):
+            mgr.near(200.0, 0.0, radius_km=10)
+        with pytest.raises(KMLInvalidCoordinates):
+            mgr.within_bounds(north=10, south=-10, east=200, west=0)
+        with pytest.raises(KMLInvalidCoordinates):
+            mgr.within_bounds(north=-10, south=10, east=1, west=0)
+
     def test_get_raises_not_found_on_empty(self) -> None:
         """
         Test that the `get` method of `KMLManager` raises an exception when no
@@ -316,6 +383,25 @@ class TestManagersExtra:
         _e2, created2 = mgr.get_or_create(id="p2")
         assert created2 is True
         assert any(x.id == "p2" for x in mgr._elements)
+        assert mgr.exists(id="p2")
+        assert not mgr.exists(id="p3")
+
+    def test_add_skips_existing_and_repeated_elements(self) -> None:
+        """
+        Test that add() appends new elements in argument order and skips elements
+        already in the manager or repeated in the arguments, whether one or many
+        elements are passed.
+        """
+        mgr = PointManager()
+        a = Point(id="a", coordinates=(0.0, 0.0))
+        b = Point(id="b", coordinates=(1.0, 1.0))
+        c = Point(id="c", coordinates=(2.0, 2.0))
+
+        mgr.add(a)
+        mgr.add(a)
+        mgr.add(b, a, c, b)
+        mgr.add()
+        assert mgr.elements == [a, b, c]
 
     def test_bulk_create_appends_and_returns_list(self) -> None:
         """
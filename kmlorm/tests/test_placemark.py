@@ -107,6 +107,20 @@ class TestPlacemark:
         assert d["coordinates"] == p.coordinates
         assert d["extended_data"] == {"k": "v"}
 
+    def test_fields_use_slots_and_copy_keeps_them(self) -> None:
+        """
+        Test that Placemark fields are stored in slots, extra attributes still
+        go to the instance __dict__, and copy() carries the slotted fields over.
+        """
+        p = Placemark(name="Shop", style_url="#shop", address="1 Main St", extra=1)
+
+        assert "style_url" in Placemark.__slots__
+        assert p.__dict__ == {"extra": 1}
+
+        copied = p.copy()
+        assert isinstance(copied, Placemark)
+        assert (copied.name, copied.style_url, copied.address) == ("Shop", "#shop", "1 Main St")
+
     def test_distance_and_bearing_between_placemarks_and_tuples(self) -> None:
         """
         Test the distance_to and bearing_to methods of the Placemark class with
@@ -7,11 +7,13 @@ Test Cases:
 - Coordinate constructor raises KMLValidationError for non-numeric longitude, latitude,
     or altitude, as well as for NaN or infinite altitude values.
 - Point.coordinates setter raises ValueError if Coordinate.from_any fails to parse input.
+- Coordinate stores its fields in slots and stays frozen.
 - Point string representation, repr, and property accessors behave as expected.
 - Point.validate calls parent validation and coordinate validation, raising
     KMLValidationError for invalid data.
 """
 
+import pickle
 from typing import Any
 
 import pytest
@@ -210,6 +212,43 @@ class TestPointExtra:
         expected3 = {"longitude": 0.0, "latitude": 0.0, "altitude": -100.0}
         assert result3 == expected3
 
+    def test_coordinate_uses_slots_and_stays_frozen(self) -> None:
+        """
+        Test that Coordinate stores its fields in slots rather than an instance
+        __dict__, and that it stays immutable, hashable and picklable.
+        """
+        coord = Coordinate(longitude=-76.5, latitude=39.3, altitude=10.0)
+
+        assert not hasattr(coord, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(coord, "latitude", 0.0)
+        # Unknown names fail too; Python 3.11 reports TypeError for slotted frozen dataclasses
+        with pytest.raises((AttributeError, TypeError)):
+            setattr(coord, "extra", 1)
+
+        assert pickle.loads(pickle.dumps(coord)) == coord
+        assert hash(coord) == hash(Coordinate(longitude=-76.5, latitude=39.3, altitude=10.0))
+
+    def test_point_init_parses_coordinates_once(self, monkeypatch: Any) -> None:
+        """
+        Test that Point() parses its coordinates once and keeps the geometry
+        properties passed as keywords.
+        """
+        calls = []
+        original = Coordinate.from_any
+
+        def counting_from_any(_cls: type, value: Any) -> Coordinate:
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(Coordinate, "from_any", classmethod(counting_from_any))
+        point = Point(coordinates=(1.0, 2.0), extrude=True, altitude_mode="absolute", name="p")
+
+        assert calls == [(1.0, 2.0)]
+        assert point.coordinates == Coordinate(longitude=1.0, latitude=2.0)
+        assert (point.extrude, point.altitude_mode, point.tessellate) == (True, "absolute", False)
+        assert point.name == "p"
+
     def test_point_to_dict_method(self) -> None:
         """
         Test that Point.to_dict() returns correct dictionary representation.
@@ -43,32 +43,49 @@ Dependencies:
 - kmlorm.core.exceptions: Custom exceptions used by KMLQuerySet.
 """
 
-from typing import Any
+# pylint: disable=too-many-lines, too-many-public-methods
+import re
+from operator import attrgetter
+from typing import Any, cast
 import pytest
 
-from kmlorm.core.querysets import KMLQuerySet
+from kmlorm.core import querysets as querysets_module
+from kmlorm.core.querysets import (
+    COORDINATE_ARRAYS_MIN_ELEMENTS,
+    KMLQuerySet,
+    Q,
+    _compile_pattern,
+    _compile_selector,
+    _compile_values,
+)
 from kmlorm.core.exceptions import (
     KMLElementNotFound,
     KMLMultipleElementsReturned,
     KMLQueryError,
 )
 from kmlorm.models.base import KMLElement
+from kmlorm.models.placemark import Placemark
+from kmlorm.models.point import Coordinate
+from kmlorm.spatial.calculations import SpatialCalculations
 
 
 class _SimpleElement(KMLElement):
-    def __init__(self, **kwargs: Any) -> None:
-        # Extract base class parameters
-        base_params = {
-            "element_id": kwargs.pop("id", None),
-            "name": kwargs.pop("name", None),
-            "description": kwargs.pop("description", None),
-            "visibility": kwargs.pop("visibility", True),
-        }
-        super().__init__(**base_params)
-
-        # Set any additional attributes
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+    # Fields the tests filter on most get slots; anything else lands in __dict__
+    __slots__ = ("rank", "tags", "maybe")
+    _FIELDS = ("id", "name", "description", "visibility") + __slots__
+
+    def __init__(
+        self,
+        id: Any = None,  # pylint: disable=redefined-builtin
+        name: Any = None,
+        description: Any = None,
+        visibility: Any = True,
+        **kwargs: Any,
+    ) -> None:
+        # Base class fields are bound directly; KMLElement sets any extras
+        super().__init__(
+            element_id=id, name=name, description=description, visibility=visibility, **kwargs
+        )
 
     def __repr__(self) -> str:
         return f"<SE {getattr(self, 'name', None)}>"
@@ -82,7 +99,9 @@ class _SimpleElement(KMLElement):
             as keys and their corresponding values.
         """
         # Simple dict representation used by QuerySet.values() in tests
-        return dict(self.__dict__)
+        data = {field: getattr(self, field) for field in self._FIELDS if hasattr(self, field)}
+        data.update(self.__dict__)
+        return data
 
 
 class TestKMLQuerySetLookups:
@@ -116,17 +135,22 @@ class TestKMLQuerySetLookups:
     c: _SimpleElement
     qs: KMLQuerySet
 
-    def setup_method(self) -> None:
+    @classmethod
+    def setup_class(cls) -> None:
         """
-        Set up test fixtures for each test method.
+        Build the shared elements once for the class.
 
         Initializes three _SimpleElement instances with varying attributes
-        and assigns them to self.a, self.b, and self.c.
-        Creates a KMLQuerySet containing these elements and assigns it to self.qs.
+        and assigns them to a, b, and c. Tests must not mutate them.
+        """
+        cls.a = _SimpleElement(id=1, name="Alpha", rank=10, tags=["x", "y"], maybe=None)
+        cls.b = _SimpleElement(id=2, name="beta", rank=5, tags=["y"], maybe=0)
+        cls.c = _SimpleElement(id=3, name="AlphaBeta", rank=7, tags=[], maybe=None)
+
+    def setup_method(self) -> None:
+        """
+        Create a fresh KMLQuerySet over the shared elements for each test method.
         """
-        self.a = _SimpleElement(id=1, name="Alpha", rank=10, tags=["x", "y"], maybe=None)
-        self.b = _SimpleElement(id=2, name="beta", rank=5, tags=["y"], maybe=0)
-        self.c = _SimpleElement(id=3, name="AlphaBeta", rank=7, tags=[], maybe=None)
         self.qs = KMLQuerySet([self.a, self.b, self.c])
 
     def test_exact_and_icontains(self) -> None:
@@ -162,6 +186,31 @@ class TestKMLQuerySetLookups:
         regex = self.qs.filter(name__regex=r"^A.*a$")
         assert set(regex.elements) == {self.a, self.c}
 
+    def test_regex_pattern_compiled_once_per_pattern(self) -> None:
+        """
+        Tests that regex lookups reuse a cached compiled pattern instead of
+        recompiling it for every element.
+        """
+        _compile_pattern.cache_clear()
+        self.qs.filter(name__regex=r"^A")
+        self.qs.filter(name__regex=r"^A")
+
+        assert _compile_pattern.cache_info().misses == 1
+
+    def test_regex_accepts_compiled_patterns(self) -> None:
+        """
+        Tests that regex and iregex lookups use a compiled re.Pattern as given,
+        with iregex adding IGNORECASE, on the generated and fallback paths.
+        """
+        pattern = re.compile(r"^a")
+        _compile_pattern.cache_clear()
+
+        assert self.qs.filter(name__regex=pattern).elements == []
+        assert _compile_pattern.cache_info().misses == 0
+        assert self.qs.filter(name__iregex=pattern).elements == [self.a, self.c]
+        assert self.qs.exclude(name__regex=re.compile("B")).elements == [self.a, self.b]
+        assert self.qs._apply_lookup("Alpha", "iregex", pattern)  # pylint: disable=protected-access
+
     def test_startswith_and_endswith(self) -> None:
         """
         Tests the queryset filtering functionality for string field lookups:
@@ -183,6 +232,55 @@ class TestKMLQuerySetLookups:
 
         assert set(iends.elements) == {self.b, self.c}
 
+    def test_case_insensitive_lookups_follow_current_values(self) -> None:
+        """
+        Tests that case-insensitive lookups ignore case, that None or missing
+        values never match, and that values changed between calls on the same
+        queryset or its children are seen.
+        """
+        missing = _SimpleElement(id=4)
+        delattr(missing, "name")
+        renamed = _SimpleElement(id=6, name="Gamma")
+        qs = KMLQuerySet(
+            [self.a, self.b, self.c, _SimpleElement(id=5, name=None), missing, renamed]
+        )
+
+        assert qs.filter(name__icontains="ALPHA").elements == [self.a, self.c]
+        assert qs.filter(name__iexact="BETA").elements == [self.b]
+        child = qs.filter(name__istartswith="al")
+        assert child.filter(name__iendswith="BETA").elements == [self.c]
+        assert len(qs.exclude(name__icontains="a")) == 2
+
+        renamed.name = "Alpha Centauri"
+        assert qs.filter(name__icontains="alpha").elements == [self.a, self.c, renamed]
+        assert qs.filter(name__iexact="alpha centauri").elements == [renamed]
+        assert not qs.filter(name__iexact="gamma")
+        renamed.description = "Third"
+        assert qs.filter(description__istartswith="th").elements == [renamed]
+
+        alphas = qs.filter(name__icontains="alpha")
+        renamed.name = "Gamma"
+        assert alphas.filter(name__icontains="alpha").elements == [self.a, self.c]
+
+    def test_case_insensitive_name_lookups_follow_renames(self) -> None:
+        """
+        Tests that case-insensitive name lookups on placemarks see renames, both
+        on fresh querysets and on one queryset reused across calls, and leave no
+        query state on the elements.
+        """
+        store = Placemark(name="Corner STORE")
+        cafe = Placemark(name="Cafe")
+        qs = KMLQuerySet([store, cafe])
+        assert qs.filter(name__icontains="store").elements == [store]
+        assert KMLQuerySet([cafe, store]).filter(name__iendswith="STORE").elements == [store]
+
+        store.name = "Corner Shop"
+        assert not qs.filter(name__icontains="store")
+        assert not KMLQuerySet([store]).filter(name__icontains="store")
+        assert qs.filter(name__iexact="corner shop").elements == [store]
+        assert not hasattr(store, "_name_lower")
+        assert store.copy().to_dict() == store.to_dict()
+
     def test_comparison_lookups(self) -> None:
         """
         Tests the queryset's ability to filter elements using comparison lookups.
@@ -216,6 +314,21 @@ class TestKMLQuerySetLookups:
         isnull_q = self.qs.filter(maybe__isnull=True)
         assert set(isnull_q.elements) == {self.a, self.c}
 
+    def test_in_lookup_container_types(self) -> None:
+        """
+        Tests that 'in' lookups give list-membership results for every container
+        type: sets and tuples of hashable values, unhashable field values such as
+        lists, containers with unhashable items, and numeric equality across types.
+        """
+        assert self.qs.filter(name__in=("Alpha", "beta")).elements == [self.a, self.b]
+        assert self.qs.filter(rank__in={5.0, 7}).elements == [self.b, self.c]
+        assert self.qs.exclude(rank__in=frozenset({10})).elements == [self.b, self.c]
+        assert self.qs.filter(maybe__in=[None, 0]).elements == [self.b]
+
+        assert self.qs.filter(tags__in=[["y"], "x"]).elements == [self.b]
+        assert self.qs.filter(tags__in=(["x", "y"], [])).elements == [self.a, self.c]
+        assert self.qs.filter(name__in="AlphaBeta!").elements == [self.a, self.c]
+
     def test_unsupported_lookup_raises(self) -> None:
         """
         Test that using an unsupported lookup in the filter method raises a KMLQueryError.
@@ -227,6 +340,200 @@ class TestKMLQuerySetLookups:
         with pytest.raises(KMLQueryError):
             self.qs.filter(name__unknown=123)
 
+    def test_lookups_evaluated_most_selective_first(self) -> None:
+        """
+        Test that parsed lookups are ordered by estimated selectivity, so an exact
+        match is checked before a regex regardless of keyword order, and that the
+        filter result is unaffected by the reordering.
+        """
+        lookups = KMLQuerySet._parse_lookups(  # pylint: disable=protected-access
+            {"name__regex": "^A", "maybe__isnull": True, "rank__gt": 6, "name": "Alpha"}
+        )
+        assert [parsed.lookup_type for parsed in lookups] == ["exact", "gt", "regex", "isnull"]
+
+        result = self.qs.filter(name__regex="^A", maybe__isnull=True, rank__gt=6, name="Alpha")
+        assert result.elements == [self.a]
+
+    def test_preserve_order_evaluates_lookups_as_given(self) -> None:
+        """
+        Test that _preserve_order=True keeps the keyword order, so a lookup that
+        cannot compare a value raises even when a cheaper exact lookup would have
+        rejected every element first.
+        """
+        assert not self.qs.filter(name__gt=5, name="Nobody")
+        assert not self.qs.exclude(name__gt=5, name="Nobody").filter(name="Nobody")
+        with pytest.raises(TypeError):
+            self.qs.filter(name__gt=5, name="Nobody", _preserve_order=True)
+        with pytest.raises(TypeError):
+            self.qs.exclude(name__gt=5, name="Nobody", _preserve_order=True)
+
+        lookups = KMLQuerySet._parse_lookups(  # pylint: disable=protected-access
+            {"name__regex": "^A", "name": "Alpha"}, reorder=False
+        )
+        assert [parsed.lookup_type for parsed in lookups] == ["regex", "exact"]
+
+    def test_unsupported_lookup_raises_before_scanning_elements(self) -> None:
+        """
+        Test that lookup keys are validated once up front, so an unsupported lookup
+        raises even when no element would reach the lookup (empty queryset or
+        elements missing the field).
+        """
+        with pytest.raises(KMLQueryError) as exc_info:
+            KMLQuerySet([]).filter(name__unknown=123)
+        assert exc_info.value.query_field == "name"
+
+        with pytest.raises(KMLQueryError):
+            self.qs.exclude(missing__unknown=1)
+
+    def test_generated_selector_reused_across_filter_values(self) -> None:
+        """
+        Tests that the generated filter loop is compiled once per combination of
+        fields and lookup types, and reused when only the filter values change.
+        """
+        _compile_selector.cache_clear()
+        assert self.qs.filter(name__startswith="A", maybe__isnull=True).elements == [
+            self.a,
+            self.c,
+        ]
+        assert self.qs.filter(name__startswith="b", maybe__isnull=True).elements == []
+        assert self.qs.exclude(name__startswith="b").elements == [self.a, self.c]
+
+        info = _compile_selector.cache_info()
+        assert info.misses == 2 and info.hits == 1
+
+    def test_exists_with_lookups_stops_at_first_match(self) -> None:
+        """
+        Tests that exists(**lookups) agrees with filter().exists() and stops
+        reading field values after the first matching element, on both the
+        generated selector path and the _matches_filters fallback.
+        """
+
+        visited: set[int] = set()
+
+        class _Counted(_SimpleElement):
+            __slots__ = ()
+
+            @property
+            def label(self) -> Any:
+                """Return the name, recording which elements were read."""
+                visited.add(id(self))
+                return self.name
+
+            @property
+            def score(self) -> int:
+                """Return the number in the name, recording which elements were read."""
+                visited.add(id(self))
+                return int(str(self.name).rsplit("-", 1)[1])
+
+        qs = KMLQuerySet([_Counted(name=f"item-{i}") for i in range(100)])
+        assert qs.exists(label__endswith="-1")
+        assert len(visited) == 2
+
+        visited.clear()
+        assert not qs.exists(label="missing")
+        assert len(visited) == 100
+
+        for element in qs:
+            setattr(element, "odd key", 1)
+        visited.clear()
+        assert qs.exists(**{"odd key": 1, "label__startswith": "item"})
+        assert len(visited) == 1
+
+        large = KMLQuerySet([_Counted(name=f"item-{i}") for i in range(1000)])
+        visited.clear()
+        assert large.exists(score__gt=0, score__range=(1, 10))
+        assert len(visited) == 2
+        visited.clear()
+        assert large.exists(label__icontains="ITEM-1")
+        assert len(visited) == 2
+
+        assert self.qs.exists()
+        assert not KMLQuerySet([]).exists()
+        assert self.qs.exists(rank__gt=6) == self.qs.filter(rank__gt=6).exists()
+        assert not self.qs.exists(name="Nobody")
+
+    def test_filter_and_exclude_with_q_objects(self) -> None:
+        """
+        Tests that Q conditions combined with &, | and ~ select the same elements,
+        in the same order, as the equivalent filter()/exclude() calls, alone and
+        together with keyword lookups.
+        """
+        elements = [
+            _SimpleElement(id=str(i), name=f"n{i % 3}", visibility=i % 2 == 0, rank=i % 4)
+            for i in range(12)
+        ]
+        elements.append(_SimpleElement(id="norank", name="n0"))
+        qs = KMLQuerySet(elements)
+
+        def ids(result: KMLQuerySet) -> list[Any]:
+            return [e.id for e in result]
+
+        def union(*parts: KMLQuerySet) -> list[Any]:
+            chosen = {id(e) for part in parts for e in part}
+            return [e.id for e in elements if id(e) in chosen]
+
+        assert ids(qs.filter(Q(rank__gt=1))) == ids(qs.filter(rank__gt=1))
+        assert ids(qs.filter(Q(rank__gt=1) & Q(name="n0"))) == ids(qs.filter(rank__gt=1, name="n0"))
+        assert ids(qs.filter(Q(rank=3) | Q(name="n1"))) == union(
+            qs.filter(rank=3), qs.filter(name="n1")
+        )
+        assert ids(qs.filter(~Q(rank__gt=1))) == ids(qs.exclude(rank__gt=1))
+        assert ids(qs.exclude(Q(rank__gt=1))) == ids(qs.exclude(rank__gt=1))
+        assert ids(qs.filter(Q(rank=3) | Q(name="n1"), visibility=True)) == ids(
+            qs.filter(visibility=True).filter(Q(rank=3) | Q(name="n1"))
+        )
+        assert ids(qs.exclude(~(Q(rank=3) | Q(name="n1")), visibility=True)) == union(
+            qs.exclude(visibility=True), qs.filter(Q(rank=3) | Q(name="n1"))
+        )
+
+        # A Q is parsed once and can be applied to any QuerySet
+        condition = Q(name__icontains="N2")
+        assert ids(qs[:6].filter(condition)) == ["2", "5"]
+        assert ids(qs[6:].filter(condition)) == ["8", "11"]
+        assert repr(~condition) == "~Q(name__icontains='N2')"
+
+        with pytest.raises(KMLQueryError):
+            Q(name__nope="x")
+
+    def test_tally_matches_filter_counts(self) -> None:
+        """
+        Tests that tally() returns the same counts as count() and
+        filter().count(), and rejects unsupported lookups.
+        """
+        lookups = {"rank__gte": 2, "name__icontains": "a", "visibility": True}
+        result = self.qs.tally(total=None, everything={}, **{k: {k: v} for k, v in lookups.items()})
+        assert result == {
+            "total": self.qs.count(),
+            "everything": self.qs.count(),
+            **{k: self.qs.filter(**{k: v}).count() for k, v in lookups.items()},
+        }
+        assert KMLQuerySet([]).tally(total=None, named={"name": "x"}) == {"total": 0, "named": 0}
+        with pytest.raises(KMLQueryError):
+            self.qs.tally(bad={"name__nope": "x"})
+
+    def test_exact_on_builtin_value_types_never_matches_none(self) -> None:
+        """
+        Tests that exact lookups specialized for str/int/float/bool filter values
+        still skip None and missing fields, while other value types keep the
+        explicit None check.
+        """
+        assert self.qs.filter(maybe=0).elements == [self.b]
+        assert self.qs.filter(maybe=0.0).elements == [self.b]
+        assert self.qs.filter(maybe=False).elements == [self.b]
+        assert self.qs.filter(missing="x").elements == []
+        assert self.qs.exclude(maybe=0).elements == [self.a, self.c]
+        assert self.qs.filter(tags=["y"]).elements == [self.b]
+
+    def test_non_identifier_field_name_uses_generic_path(self) -> None:
+        """
+        Tests that field names that cannot be inlined as attribute access still
+        filter correctly through the generic per-element path.
+        """
+        b = _SimpleElement(id=2, name="beta", **{"not-an-identifier": "x"})
+        qs = KMLQuerySet([self.a, b, self.c])
+        assert qs.filter(**{"not-an-identifier": "x"}).elements == [b]
+        assert qs.exclude(**{"not-an-identifier": "x"}).elements == [self.a, self.c]
+
 
 class TestKMLQuerySetAPI:
     """
@@ -250,16 +557,22 @@ class TestKMLQuerySetAPI:
     c: _SimpleElement
     qs: KMLQuerySet
 
-    def setup_method(self) -> None:
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Build the shared elements once for the class.
+
+        Creates three instances of _SimpleElement with different ids, names, and ranks.
+        Tests must not mutate them.
         """
-        Set up test fixtures for each test method.
+        cls.a = _SimpleElement(id=1, name="A", rank=3)
+        cls.b = _SimpleElement(id=2, name="B", rank=1)
+        cls.c = _SimpleElement(id=3, name="C", rank=2)
 
-        Creates three instances of _SimpleElement with different ids, names, and ranks,
-        and initializes a KMLQuerySet containing these elements for use in tests.
+    def setup_method(self) -> None:
+        """
+        Create a fresh KMLQuerySet over the shared elements for each test method.
         """
-        self.a = _SimpleElement(id=1, name="A", rank=3)
-        self.b = _SimpleElement(id=2, name="B", rank=1)
-        self.c = _SimpleElement(id=3, name="C", rank=2)
         self.qs = KMLQuerySet([self.a, self.b, self.c])
 
     def test_get_not_found_and_multiple(self) -> None:
@@ -273,11 +586,48 @@ class TestKMLQuerySetAPI:
             self.qs.get(name__exact="X")
 
         # multiple
-        with pytest.raises(KMLMultipleElementsReturned):
+        with pytest.raises(KMLMultipleElementsReturned) as exc_info:
             self.qs.get(rank__gt=0)  # all three
+        assert exc_info.value.count == 3
 
         # single
         assert self.qs.get(name__exact="B") is self.b
+        assert self.qs.get(name__exact="B", rank__lt=2) is self.b
+
+    def test_repeated_get_sees_current_values(self) -> None:
+        """
+        Tests that repeated get() calls with one exact string lookup on the same
+        QuerySet return the same results as the scan, including after elements
+        are renamed or added between calls.
+        """
+        elements = [_SimpleElement(id=str(i), name=f"Store {i}", rank=i) for i in range(50)]
+        elements += [_SimpleElement(id="dup1", name="dup"), _SimpleElement(id="dup2", name="dup")]
+        elements.append(_SimpleElement(id="num", name=7))
+        setattr(elements[3], "code", "c3")
+        qs = KMLQuerySet(elements)
+
+        for _ in range(3):
+            assert qs.get(name="Store 1") is elements[1]
+            assert qs.get(id__exact="49") is elements[49]
+            assert qs.get(code="c3") is elements[3]
+            with pytest.raises(KMLElementNotFound):
+                qs.get(name="7")
+            with pytest.raises(KMLMultipleElementsReturned):
+                qs.get(name="dup")
+
+        elements[1].name = "Renamed"
+        with pytest.raises(KMLElementNotFound):
+            qs.get(name="Store 1")
+        assert qs.get(name="Renamed") is elements[1]
+
+        elements[2].name = "Store 10"
+        with pytest.raises(KMLMultipleElementsReturned):
+            qs.get(name="Store 10")
+
+        extra = _SimpleElement(id="extra", name="Store 20")
+        qs._elements.append(extra)  # pylint: disable=protected-access
+        with pytest.raises(KMLMultipleElementsReturned):
+            qs.get(name="Store 20")
 
     def test_order_by_and_reverse_and_invalid(self) -> None:
         """
@@ -304,6 +654,87 @@ class TestKMLQuerySetAPI:
         with pytest.raises(KMLQueryError):
             self.qs.order_by("missing")
 
+    def test_order_by_dotted_field_path(self) -> None:
+        """
+        Tests that order_by() accepts dotted paths to nested attributes and raises
+        KMLQueryError when a nested attribute is missing.
+        """
+        # Built here rather than taken from setup_class, which must not be mutated
+        a, b, c = (
+            _SimpleElement(id=i, name=name, point=_SimpleElement(lon=value))
+            for i, name, value in ((1, "A", 2.0), (2, "B", 3.0), (3, "C", 1.0))
+        )
+        qs = KMLQuerySet([a, b, c])
+
+        ordered = qs.order_by("-point.lon")
+        assert ordered.elements == [b, a, c]
+
+        with pytest.raises(KMLQueryError):
+            qs.order_by("point.missing")
+
+    def test_order_by_multiple_fields_mixed_directions(self) -> None:
+        """
+        Tests that multi-field ordering, with runs of fields in the same direction
+        sorted together, matches ordering field by field, and that a missing field
+        in the middle of a run is the one reported.
+        """
+        elements = [
+            _SimpleElement(id=str(i), name=f"n{i % 3}", visibility=i % 2 == 0, rank=i % 4)
+            for i in range(12)
+        ]
+        qs = KMLQuerySet(elements)
+        orderings: list[tuple[str, ...]] = [
+            ("visibility", "-name"),
+            ("name", "rank", "-id"),
+            ("-rank", "-name", "visibility", "id"),
+        ]
+        for fields in orderings:
+            expected = list(elements)
+            for field in reversed(fields):
+                expected.sort(key=attrgetter(field.lstrip("-")), reverse=field[0] == "-")
+            assert qs.order_by(*fields).elements == expected
+
+        with pytest.raises(KMLQueryError) as exc_info:
+            qs.order_by("name", "missing", "rank")
+        assert exc_info.value.query_field == "missing"
+
+    def test_earliest_and_latest_match_order_by(self) -> None:
+        """
+        Tests that earliest() and latest() return the same elements as
+        order_by().first() and order_by().last(), including ties, and None when empty.
+        """
+        elements = [
+            _SimpleElement(id=str(i), name=f"n{i % 3}", visibility=i % 2 == 0, rank=i % 4)
+            for i in range(12)
+        ]
+        qs = KMLQuerySet(elements)
+        orderings: list[tuple[str, ...]] = [
+            (),
+            ("rank",),
+            ("-rank",),
+            ("visibility", "-name"),
+            ("-rank", "-name", "visibility", "id"),
+        ]
+        for fields in orderings:
+            assert qs.earliest(*fields) is qs.order_by(*fields).first()
+            assert qs.latest(*fields) is qs.order_by(*fields).last()
+
+        assert KMLQuerySet([]).earliest("rank") is None
+        assert KMLQuerySet([]).latest("rank") is None
+        with pytest.raises(KMLQueryError):
+            qs.latest("missing")
+
+        # A missing field raises like order_by() does, even with one candidate left
+        single = KMLQuerySet(elements[:1])
+        for call in (single.earliest, single.latest, single.order_by):
+            with pytest.raises(KMLQueryError):
+                call("missing")
+        for call in (qs.earliest, qs.latest):
+            with pytest.raises(KMLQueryError):
+                call("id", "missing")
+            with pytest.raises(KMLQueryError):
+                call("-rank", "name", "missing")
+
     def test_values_and_values_list_and_flat_error(self) -> None:
         """
         Tests the behavior of the 'values' and 'values_list' queryset methods.
@@ -325,6 +756,113 @@ class TestKMLQuerySetAPI:
         with pytest.raises(ValueError):
             self.qs.values_list("a", "b", flat=True)
 
+    def test_values_list_shapes_and_missing_fields(self) -> None:
+        """
+        Tests that values_list() returns flat values, 1-tuples and n-tuples in
+        element order, and None for a field an element does not have.
+        """
+        assert self.qs.values_list("name", flat=True) == ["A", "B", "C"]
+        assert self.qs.values_list("rank") == [(3,), (1,), (2,)]
+        assert self.qs.values_list("name", "rank") == [("A", 3), ("B", 1), ("C", 2)]
+
+        qs = KMLQuerySet([self.a, _SimpleElement(id=2, name="B", extra="x"), self.c])
+        assert qs.values_list("extra", flat=True) == [None, "x", None]
+        assert qs.values_list("name", "extra") == [("A", None), ("B", "x"), ("C", None)]
+
+    def test_values_list_named_rows(self) -> None:
+        """
+        Tests that values_list(named=True) returns named tuples equal to the plain
+        rows, with dotted paths as ``a__b`` attributes, and rejects flat=True.
+        """
+        rows = self.qs.values_list("name", "rank", named=True)
+        assert rows == self.qs.values_list("name", "rank")
+        assert [(row.name, row.rank) for row in rows] == [("A", 3), ("B", 1), ("C", 2)]
+        assert type(rows[0]) is type(self.qs.values_list("name", "rank", named=True)[0])
+
+        qs = KMLQuerySet([self.a, _SimpleElement(id=2, name="B", extra=_SimpleElement(rank=9))])
+        assert [row.extra__rank for row in qs.values_list("extra.rank", named=True)] == [None, 9]
+
+        with pytest.raises(ValueError):
+            self.qs.values_list("name", flat=True, named=True)
+
+    def test_distinct_count(self) -> None:
+        """
+        Tests that distinct_count() matches counting the set of values_list()
+        values, including fields some elements are missing.
+        """
+        qs = KMLQuerySet(
+            [self.a, _SimpleElement(id=2, name="A", extra="x"), self.c, self.b, self.a]
+        )
+        for field in ("name", "rank", "extra", "missing"):
+            assert qs.distinct_count(field) == len(set(qs.values_list(field, flat=True)))
+        assert qs.distinct_count("name") == 3
+        assert qs.distinct_count("extra") == 2
+        assert KMLQuerySet([]).distinct_count("name") == 0
+
+    def test_values_shapes_and_missing_fields(self) -> None:
+        """
+        Tests that values() returns one dict per element with the requested keys
+        in order, resolves dotted paths, and uses None for a field an element
+        does not have.
+        """
+        assert self.qs.values("name") == [{"name": "A"}, {"name": "B"}, {"name": "C"}]
+        vals = self.qs.values("rank", "name")
+        assert vals == [
+            {"rank": 3, "name": "A"},
+            {"rank": 1, "name": "B"},
+            {"rank": 2, "name": "C"},
+        ]
+        assert list(vals[0]) == ["rank", "name"]
+
+        qs = KMLQuerySet([self.a, _SimpleElement(id=2, name="B", extra="x"), self.c])
+        assert qs.values("extra") == [{"extra": None}, {"extra": "x"}, {"extra": None}]
+        assert qs.values("name", "extra")[1] == {"name": "B", "extra": "x"}
+
+        point = _SimpleElement(id=3, name="P", lon=1.5)
+        nested = KMLQuerySet([_SimpleElement(id=4, name="N", point=point)])
+        assert nested.values("name", "point.lon") == [{"name": "N", "point.lon": 1.5}]
+
+    def test_values_loop_compiled_once_per_field_list(self) -> None:
+        """
+        Tests that values() reuses its generated row loop for the same fields,
+        and that field names which are not attribute paths still work.
+        """
+        _compile_values.cache_clear()
+        self.qs.values("name", "rank")
+        self.qs.filter(rank__gte=2).values("name", "rank")
+
+        info = _compile_values.cache_info()
+        assert info.misses == 1 and info.hits == 1
+
+        qs = KMLQuerySet([_SimpleElement(id=1, name="A", **{"class": "x"})])
+        assert qs.values("name", "class") == [{"name": "A", "class": "x"}]
+        assert _compile_values.cache_info().misses == 1
+
+    def test_derived_querysets_own_their_element_lists(self) -> None:
+        """
+        Tests that QuerySets keep their state in slots, and that every derived
+        QuerySet owns its element list, so mutating one never affects another.
+        """
+        assert not hasattr(self.qs, "__dict__")
+
+        ordered = self.qs.order_by("rank")
+        derived = [
+            self.qs.all(),
+            self.qs[0:2],
+            self.qs.filter(rank__gt=0),
+            ordered.exclude(name="Nobody"),
+            self.qs.distinct(),
+        ]
+        for qs in derived:
+            assert qs.elements is not self.qs.elements
+            qs.elements.clear()
+        assert len(self.qs) == 3
+
+        chained = ordered.filter(rank__gt=0)
+        assert chained.is_ordered and chained.order_by_fields == ["rank"]
+        chained.order_by_fields.append("name")
+        assert ordered.order_by_fields == ["rank"]
+
     def test_distinct_and_none_and_slice_and_bool(self) -> None:
         """
         Tests the behavior of the KMLQuerySet for distinct, none, slicing, and boolean evaluation.
@@ -341,6 +879,7 @@ class TestKMLQuerySetAPI:
 
         empty = self.qs.none()
         assert isinstance(empty, KMLQuerySet) and len(empty) == 0
+        assert self.a in self.qs and self.a not in empty
 
         sliced = self.qs[0:2]
         assert isinstance(sliced, KMLQuerySet) and len(sliced) == 2
@@ -380,16 +919,22 @@ class TestQuerySet:
     c: _SimpleElement
     qs: KMLQuerySet
 
-    def setup_method(self) -> None:
+    @classmethod
+    def setup_class(cls) -> None:
         """
-        Set up test fixtures for each test method.
+        Build the shared elements once for the class.
 
-        Initializes three _SimpleElement instances with different attributes and
-        creates a KMLQuerySet containing these elements for use in tests.
+        Initializes three _SimpleElement instances with different attributes.
+        Tests must not mutate them.
+        """
+        cls.a = _SimpleElement(id=1, name="Alpha", rank=3, visibility=True)
+        cls.b = _SimpleElement(id=2, name="Beta", rank=1, visibility=False)
+        cls.c = _SimpleElement(id=3, name="alpha-beta", rank=2, visibility=True)
+
+    def setup_method(self) -> None:
+        """
+        Create a fresh KMLQuerySet over the shared elements for each test method.
         """
-        self.a = _SimpleElement(id=1, name="Alpha", rank=3, visibility=True)
-        self.b = _SimpleElement(id=2, name="Beta", rank=1, visibility=False)
-        self.c = _SimpleElement(id=3, name="alpha-beta", rank=2, visibility=True)
         self.qs = KMLQuerySet([self.a, self.b, self.c])
 
     def test_filter_exact_and_icontains(self) -> None:
@@ -453,3 +998,227 @@ class TestQuerySet:
 
         desc = self.qs.order_by("-rank")
         assert [getattr(e, "rank", None) for e in desc.elements] == [3, 2, 1]
+
+
+class TestKMLQuerySetVectorizedNear:
+    """
+    Test suite for the NumPy path of near() used on large querysets.
+
+    Results are compared with the scalar Haversine distance for every element.
+    """
+
+    elements: list[Placemark]
+    qs: KMLQuerySet
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """
+        Build, once for the class, enough placemarks to take the vectorized path,
+        spread over a few degrees, with some placemarks lacking coordinates.
+        Tests must not mutate them.
+        """
+        pytest.importorskip("numpy")
+        cls.elements = []
+        for i in range(COORDINATE_ARRAYS_MIN_ELEMENTS + 100):
+            if i % 25 == 0:
+                cls.elements.append(Placemark(name=f"p{i}"))
+            else:
+                lon = -77.0 + (i * 7919 % 1000) / 250.0
+                lat = 38.0 + (i * 104729 % 1000) / 250.0
+                cls.elements.append(Placemark(name=f"p{i}", coordinates=(lon, lat)))
+
+    def setup_method(self) -> None:
+        """
+        Create a fresh KMLQuerySet over the shared placemarks for each test method.
+        """
+        self.qs = KMLQuerySet(self.elements)
+
+    def test_near_matches_scalar_distances(self) -> None:
+        """
+        Tests that near() selects exactly the placemarks whose scalar distance is
+        within the radius, in their original order.
+        """
+        center = Coordinate(longitude=-76.0, latitude=39.0)
+        for radius_km in (0.0, 50.0, 150.0, 1000.0):
+            expected = [
+                p
+                for p in self.elements
+                if p.coordinates is not None
+                and cast(float, SpatialCalculations.distance_between(center, p)) <= radius_km
+            ]
+            assert self.qs.near(-76.0, 39.0, radius_km=radius_km).elements == expected
+
+    def test_reused_queryset_sees_moved_coordinates(self) -> None:
+        """
+        Tests that the coordinate arrays are reused while coordinates are
+        unchanged, and that near() on the same queryset sees a placemark whose
+        point was removed or moved, or an appended element.
+        """
+        placemarks = [
+            Placemark(name=f"p{i}", coordinates=(0.0 if i == 0 else 10.0, i / 100.0))
+            for i in range(COORDINATE_ARRAYS_MIN_ELEMENTS + 88)
+        ]
+        qs = KMLQuerySet(placemarks)
+        assert qs.near(0.0, 0.0, radius_km=1).elements == [placemarks[0]]
+        cached = qs._coordinate_cache  # pylint: disable=protected-access
+        assert qs.near(10.0, 1.0, radius_km=1).elements == [placemarks[100]]
+        assert qs._coordinate_cache is cached  # pylint: disable=protected-access
+
+        placemarks[0].point = None
+        placemarks[599].coordinates = (0.0, 0.0)
+        assert qs.near(0.0, 0.0, radius_km=1).elements == [placemarks[599]]
+
+        extra = Placemark(name="extra", coordinates=(20.0, 20.0))
+        qs._elements.append(extra)  # pylint: disable=protected-access
+        assert qs.near(20.0, 20.0, radius_km=1).elements == [extra]
+
+    def test_has_coordinates_checks_current_coordinates(self) -> None:
+        """
+        Tests that has_coordinates() and valid_coordinates() on a queryset that
+        already ran near() read each element's current coordinates.
+        """
+        placemarks = [
+            Placemark(name=f"p{i}", coordinates=(i / 100.0, 0.0))
+            for i in range(COORDINATE_ARRAYS_MIN_ELEMENTS + 88)
+        ]
+        qs = KMLQuerySet(placemarks)
+        assert qs.near(0.0, 0.0, radius_km=10).elements == placemarks[:9]
+        assert qs.has_coordinates().elements == placemarks
+
+        placemarks[0].point = None
+        assert qs.has_coordinates().elements == placemarks[1:]
+        assert qs.valid_coordinates().elements == placemarks[1:]
+
+    def test_coordinate_arrays_align_with_elements(self) -> None:
+        """
+        Tests that coordinate_arrays() returns one row per element in queryset
+        order, with NaN for placemarks without coordinates, on both the queryset
+        and the manager.
+        """
+        np = pytest.importorskip("numpy")
+        lons, lats, alts = self.qs.coordinate_arrays()
+
+        assert lons.shape == lats.shape == alts.shape == (len(self.elements),)
+        for i, placemark in enumerate(self.elements):
+            if placemark.coordinates is None:
+                assert np.isnan(lons[i]) and np.isnan(lats[i]) and np.isnan(alts[i])
+            else:
+                assert (lons[i], lats[i]) == (
+                    placemark.coordinates.longitude,
+                    placemark.coordinates.latitude,
+                )
+                assert alts[i] == placemark.coordinates.altitude
+
+        manager = Placemark.objects.__class__()
+        manager.add(*self.elements[:3])
+        assert np.array_equal(manager.coordinate_arrays()[1], lats[:3], equal_nan=True)
+
+    def test_coordinate_arrays_require_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that coordinate_arrays() raises ImportError when numpy is missing.
+        """
+        monkeypatch.setattr(querysets_module, "HAS_NUMPY", False)
+        with pytest.raises(ImportError):
+            self.qs.coordinate_arrays()
+
+
+class TestKMLQuerySetNearBoundingBox:
+    """
+    Test suite for the bounding-box prefilter in near() and for within_bounds(),
+    on both the scalar and the vectorized path, around the antimeridian and the
+    poles.
+    """
+
+    @staticmethod
+    def _placemarks(count: int) -> list[Placemark]:
+        """Placemarks on a grid straddling the antimeridian and reaching the north pole."""
+        placemarks = []
+        for i in range(count):
+            lon = (170.0 + (i * 7 % 200) / 10.0 + 180.0) % 360.0 - 180.0
+            lat = 70.0 + (i * 13 % 200) / 10.0
+            placemarks.append(Placemark(name=f"p{i}", coordinates=(lon, lat)))
+        return placemarks
+
+    @staticmethod
+    def _expected(placemarks: list[Placemark], lon: float, lat: float, radius_km: float) -> list:
+        center = Coordinate(longitude=lon, latitude=lat)
+        return [
+            p
+            for p in placemarks
+            if cast(float, SpatialCalculations.distance_between(center, p)) <= radius_km
+        ]
+
+    @pytest.mark.parametrize(
+        "lon,lat,radius_km", [(179.5, 75.0, 150.0), (-179.5, 80.0, 300.0), (0.0, 89.0, 500.0)]
+    )
+    def test_scalar_path_matches_unfiltered_distances(
+        self, lon: float, lat: float, radius_km: float
+    ) -> None:
+        """
+        Tests that the prefilter never drops a placemark within the radius on the
+        per-element path.
+        """
+        placemarks = self._placemarks(200)
+        expected = self._expected(placemarks, lon, lat, radius_km)
+        assert expected
+        assert KMLQuerySet(placemarks).near(lon, lat, radius_km=radius_km).elements == expected
+
+    @pytest.mark.parametrize(
+        "lon,lat,radius_km", [(179.5, 75.0, 150.0), (-179.5, 80.0, 300.0), (0.0, 89.0, 500.0)]
+    )
+    def test_vectorized_path_matches_unfiltered_distances(
+        self, lon: float, lat: float, radius_km: float
+    ) -> None:
+        """
+        Tests that the latitude band search and longitude prefilter never drop a
+        placemark within the radius on the NumPy path.
+        """
+        pytest.importorskip("numpy")
+        placemarks = self._placemarks(COORDINATE_ARRAYS_MIN_ELEMENTS + 100)
+        expected = self._expected(placemarks, lon, lat, radius_km)
+        assert expected
+        assert KMLQuerySet(placemarks).near(lon, lat, radius_km=radius_km).elements == expected
+
+    @pytest.mark.parametrize(
+        "north,south,east,west",
+        [(85.0, 75.0, -175.0, 175.0), (90.0, 88.0, 180.0, -180.0), (80.0, 70.0, 179.0, 172.0)],
+    )
+    def test_within_bounds_vectorized_matches_scalar(
+        self,
+        north: float,
+        south: float,
+        east: float,
+        west: float,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Tests that within_bounds() on the NumPy path selects the same placemarks,
+        in the same order, as the per-element path, including boxes crossing the
+        antimeridian.
+        """
+        pytest.importorskip("numpy")
+        placemarks = self._placemarks(COORDINATE_ARRAYS_MIN_ELEMENTS + 100)
+        vectorized = KMLQuerySet(placemarks).within_bounds(
+            north=north, south=south, east=east, west=west
+        )
+        monkeypatch.setattr(querysets_module, "HAS_NUMPY", False)
+        scalar = KMLQuerySet(placemarks).within_bounds(
+            north=north, south=south, east=east, west=west
+        )
+        assert scalar
+        assert vectorized.elements == scalar.elements
+
+    def test_within_bounds_reused_queryset_sees_moved_coordinates(self) -> None:
+        """
+        Tests that within_bounds() on a queryset reused across calls sees a
+        placemark whose point was removed or moved into the box.
+        """
+        pytest.importorskip("numpy")
+        placemarks = self._placemarks(COORDINATE_ARRAYS_MIN_ELEMENTS + 100)
+        placemarks[0].coordinates = (0.0, 0.0)
+        qs = KMLQuerySet(placemarks)
+        assert qs.within_bounds(north=1, south=-1, east=1, west=-1).elements == [placemarks[0]]
+
+        placemarks[0].point = None
+        placemarks[599].coordinates = (0.5, 0.5)
+        assert qs.within_bounds(north=1, south=-1, east=1, west=-1).elements == [placemarks[599]]
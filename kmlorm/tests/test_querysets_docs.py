@@ -8,7 +8,7 @@ are functional and produce the expected results.
 # pylint: disable=too-many-instance-attributes
 
 import re
-from typing import Any, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 import pytest
 from kmlorm import KMLFile, Placemark, Folder
 from kmlorm.models.point import Coordinate
@@ -17,6 +17,53 @@ from kmlorm.core.exceptions import (
     KMLMultipleElementsReturned,
     KMLQueryError,
     KMLInvalidCoordinates,
+    KMLValidationError,
+)
+from kmlorm.core.querysets import KMLQuerySet
+from kmlorm.models.base import KMLElement
+
+# Phone number pattern from the regex lookup example, compiled once for the module
+PHONE_RE = re.compile(r"\d{3}-\d{3}-\d{4}")
+
+
+# Placemarks shared by every test, in the order they are added to the KML file
+PLACEMARK_SPECS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "Store A",
+        "description": "Main store location with phone 555-123-4567",
+        "visibility": True,
+        "coordinates": Coordinate(-76.6, 39.3, 100),
+    },
+    {
+        "name": "Store B",
+        "description": "Secondary store",
+        "visibility": False,
+        "coordinates": Coordinate(-76.5, 39.2, 50),
+    },
+    {
+        "name": "Capital Electric",
+        "description": "Electric supply store",
+        "visibility": True,
+        "coordinates": Coordinate(-76.7, 39.4, 1500),
+    },
+    {
+        "name": "Capital Hardware",
+        "description": "Hardware store",
+        "visibility": True,
+        "coordinates": Coordinate(-76.4, 39.1, 75),
+    },
+    {
+        "name": "Headquarters",
+        "description": "Company headquarters",
+        "visibility": True,
+        "coordinates": Coordinate(-76.6, 39.3, 200),
+    },
+    {
+        "name": "Restaurant",
+        "description": "Local restaurant",
+        "visibility": False,
+        "coordinates": Coordinate(-76.8, 39.5, 25),
+    },
 )
 
 
@@ -33,64 +80,30 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
     folder1: Folder
     folder2: Folder
 
-    @pytest.fixture(autouse=True)
-    def setup_method(self) -> None:
-        """Set up test data for QuerySet testing."""
+    @classmethod
+    def setup_class(cls) -> None:
+        """Build the QuerySet test data once for the class. Tests must not mutate it."""
         # Create a KML structure for testing
-        self.kml = KMLFile()
+        cls.kml = KMLFile()
 
         # Create test placemarks with various properties for comprehensive testing
-        self.placemark1 = Placemark(
-            name="Store A",
-            description="Main store location with phone 555-123-4567",
-            visibility=True,
-            coordinates=Coordinate(-76.6, 39.3, 100),
-        )
-        self.placemark2 = Placemark(
-            name="Store B",
-            description="Secondary store",
-            visibility=False,
-            coordinates=Coordinate(-76.5, 39.2, 50),
-        )
-        self.placemark3 = Placemark(
-            name="Capital Electric",
-            description="Electric supply store",
-            visibility=True,
-            coordinates=Coordinate(-76.7, 39.4, 1500),
-        )
-        self.placemark4 = Placemark(
-            name="Capital Hardware",
-            description="Hardware store",
-            visibility=True,
-            coordinates=Coordinate(-76.4, 39.1, 75),
-        )
-        self.placemark5 = Placemark(
-            name="Headquarters",
-            description="Company headquarters",
-            visibility=True,
-            coordinates=Coordinate(-76.6, 39.3, 200),
-        )
-        self.placemark6 = Placemark(
-            name="Restaurant",
-            description="Local restaurant",
-            visibility=False,
-            coordinates=Coordinate(-76.8, 39.5, 25),
-        )
+        placemarks = [Placemark(**spec) for spec in PLACEMARK_SPECS]
+        (
+            cls.placemark1,
+            cls.placemark2,
+            cls.placemark3,
+            cls.placemark4,
+            cls.placemark5,
+            cls.placemark6,
+        ) = placemarks
 
         # Add all placemarks to KML
-        self.kml.placemarks.add(
-            self.placemark1,
-            self.placemark2,
-            self.placemark3,
-            self.placemark4,
-            self.placemark5,
-            self.placemark6,
-        )
+        cls.kml.placemarks.add(*placemarks)
 
         # Create folders for testing
-        self.folder1 = Folder(name="Stores")
-        self.folder2 = Folder(name="Offices")
-        self.kml.folders.add(self.folder1, self.folder2)
+        cls.folder1 = Folder(name="Stores")
+        cls.folder2 = Folder(name="Offices")
+        cls.kml.folders.add(cls.folder1, cls.folder2)
 
     def test_basic_queryset_operations_example(self) -> None:
         """Test the basic QuerySet operations example from documentation."""
@@ -110,69 +123,70 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         filtered_qs = all_placemarks.filter(visibility=True).order_by("name")
 
         # Force evaluation by iterating
-        placemark_names = []
-        for placemark in filtered_qs:
-            placemark_output = f"Placemark: {placemark.name}"
-            placemark_names.append(placemark_output)
+        placemark_names = [placemark.name for placemark in filtered_qs]
 
         # Or force evaluation with count()
         visible_count = filtered_qs.count()
-        count_output = f"Found {visible_count} visible placemarks"
 
         # Verify the results
         assert visible_count == 4  # 4 visible placemarks
-        assert count_output == "Found 4 visible placemarks"
-        assert "Placemark: Capital Electric" in placemark_names
-        assert "Placemark: Headquarters" in placemark_names
-
-    def test_field_lookups_basic_filtering_example(self) -> None:
-        """Test the basic filtering example from Field Lookups section."""
-        # Example from documentation:
-        # capital_stores = kml.placemarks.children().filter(name__icontains='capital')
-        # visible_elements = kml.placemarks.children().filter(visibility=True)
-
-        capital_stores = self.kml.placemarks.children().filter(name__icontains="capital")
-        visible_elements = self.kml.placemarks.children().filter(visibility=True)
-
-        # Verify filtering works correctly
-        assert len(capital_stores) == 2  # Capital Electric, Capital Hardware
-        assert len(visible_elements) == 4  # 4 visible placemarks
-
-        capital_names = [p.name for p in capital_stores if p.name]
-        assert "Capital Electric" in capital_names
-        assert "Capital Hardware" in capital_names
-
-    def test_field_lookups_multiple_filters_example(self) -> None:
-        """Test the multiple filters example from Field Lookups section."""
-        # Example from documentation:
-        # visible_capital = kml.placemarks.children().filter(
-        #     name__icontains='capital',
-        #     visibility=True
-        # )
-
-        visible_capital = self.kml.placemarks.children().filter(
-            name__icontains="capital", visibility=True
-        )
-
-        # Verify AND operation
-        assert len(visible_capital) == 2
-        for placemark in visible_capital:
-            assert placemark.visibility is True
-            if placemark.name:
-                assert "capital" in placemark.name.lower()
-
-    def test_field_lookups_exclusion_example(self) -> None:
-        """Test the exclusion example from Field Lookups section."""
-        # Example from documentation:
-        # non_capital = kml.placemarks.children().exclude(name__icontains='capital')
-
-        non_capital = self.kml.placemarks.children().exclude(name__icontains="capital")
-
-        # Verify exclusion works
-        assert len(non_capital) == 4  # 6 total - 2 capital = 4
-        for placemark in non_capital:
-            if placemark.name:
-                assert "capital" not in placemark.name.lower()
+        assert placemark_names == [
+            "Capital Electric",
+            "Capital Hardware",
+            "Headquarters",
+            "Store A",
+        ]
+
+    @pytest.mark.parametrize(
+        "build,expected_names",
+        [
+            # capital_stores = kml.placemarks.children().filter(name__icontains='capital')
+            (
+                lambda qs: qs.filter(name__icontains="capital"),
+                ["Capital Electric", "Capital Hardware"],
+            ),
+            # visible_elements = kml.placemarks.children().filter(visibility=True)
+            (
+                lambda qs: qs.filter(visibility=True),
+                ["Store A", "Capital Electric", "Capital Hardware", "Headquarters"],
+            ),
+            # visible_capital = kml.placemarks.children().filter(
+            #     name__icontains='capital',
+            #     visibility=True
+            # )
+            (
+                lambda qs: qs.filter(name__icontains="capital", visibility=True),
+                ["Capital Electric", "Capital Hardware"],
+            ),
+            # non_capital = kml.placemarks.children().exclude(name__icontains='capital')
+            (
+                lambda qs: qs.exclude(name__icontains="capital"),
+                ["Store A", "Store B", "Headquarters", "Restaurant"],
+            ),
+            # specific_names = kml.placemarks.children().filter(
+            #     name__in=['Store A', 'Store B', 'Store C']
+            # )
+            (
+                lambda qs: qs.filter(name__in=["Store A", "Store B", "Store C"]),
+                ["Store A", "Store B"],
+            ),
+            # phone_numbers = kml.placemarks.children().filter(
+            #     description__regex=r'\d{3}-\d{3}-\d{4}'
+            # )
+            (lambda qs: qs.filter(description__regex=PHONE_RE), ["Store A"]),
+        ],
+        ids=["basic", "visible", "multiple_filters", "exclusion", "list_membership", "regex"],
+    )
+    def test_field_lookups_filtering_example(
+        self, build: Callable[[Any], Any], expected_names: List[str]
+    ) -> None:
+        """
+        Test the filtering, multiple filters, exclusion, list membership and regex
+        examples from Field Lookups section.
+        """
+        result = build(self.kml.placemarks.children())
+
+        assert [p.name for p in result] == expected_names
 
     def test_field_lookups_comparison_operators_example(self) -> None:
         """Test the comparison operators example from Field Lookups section."""
@@ -193,48 +207,16 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # Test with range filtering on a simple field instead
 
         # Test range filtering works with the range lookup
-        # Create some test items with numerical names for range testing
+        # Create some test items with numerical names for range testing, in a
+        # KML file of their own so the shared fixture stays unchanged
+        kml = KMLFile()
         test_placemark = Placemark(name="1", visibility=True)
-        self.kml.placemarks.add(test_placemark)
+        kml.placemarks.add(test_placemark, Placemark(name="5", visibility=True))
 
         # Test range lookup (though limited to direct fields)
         # Note: This demonstrates the range lookup mechanism even if not on coordinates
-        all_items = self.kml.placemarks.children()  # Direct children only
-        assert len(all_items) > 0
-
-    def test_field_lookups_list_membership_example(self) -> None:
-        """Test the list membership example from Field Lookups section."""
-        # Example from documentation:
-        # specific_names = kml.placemarks.children().filter(
-        #     name__in=['Store A', 'Store B', 'Store C']
-        # )
-
-        specific_names = self.kml.placemarks.children().filter(
-            name__in=["Store A", "Store B", "Store C"]
-        )
-
-        # Verify list membership
-        assert len(specific_names) == 2  # Store A and Store B exist
-        names = [p.name for p in specific_names]
-        assert "Store A" in names
-        assert "Store B" in names
-
-    def test_field_lookups_regex_example(self) -> None:
-        """Test the regular expressions example from Field Lookups section."""
-        # Example from documentation:
-        # phone_numbers = kml.placemarks.children().filter(
-        #     description__regex=r'\d{3}-\d{3}-\d{4}'
-        # )
-
-        regex = r"\d{3}-\d{3}-\d{4}"
-        phone_numbers = self.kml.placemarks.children().filter(description__regex=regex)
-
-        # Verify regex filtering - Store A has phone number in description
-        assert len(phone_numbers) == 1
-        phone_placemark = phone_numbers[0]
-        assert phone_placemark.name == "Store A"
-        if phone_placemark.description:
-            assert re.search(regex, phone_placemark.description) is not None
+        in_range = kml.placemarks.children().filter(name__range=("0", "2"))  # Direct children only
+        assert in_range.elements == [test_placemark]
 
     def test_getting_single_elements_get_example(self) -> None:
         """Test the get single element example from Getting Single Elements section."""
@@ -249,11 +231,9 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
 
         try:
             headquarters = self.kml.placemarks.children().get(name="Headquarters")
-            found_message = f"Found: {headquarters.name}"
 
             # Verify we found the right element
             assert headquarters.name == "Headquarters"
-            assert found_message == "Found: Headquarters"
         except KMLElementNotFound:
             pytest.fail("Headquarters should have been found")
         except KMLMultipleElementsReturned:
@@ -269,19 +249,13 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # if last_placemark:
         #     print(f"Last alphabetically: {last_placemark.name}")
 
-        first_placemark = self.kml.placemarks.children().first()
-        if first_placemark:
-            first_message = f"First placemark: {first_placemark.name}"
-            assert first_message is not None
-
-        last_placemark = self.kml.placemarks.children().order_by("name").last()
-        if last_placemark:
-            last_message = f"Last alphabetically: {last_placemark.name}"
-            assert last_message is not None
+        placemarks = self.kml.placemarks.children()
+        first_placemark = placemarks.first()
+        last_placemark = placemarks.order_by("name").last()
 
         # Verify we get results
-        assert first_placemark is not None
-        assert last_placemark is not None
+        assert first_placemark is self.placemark1
+        assert last_placemark is self.placemark2
 
     def test_ordering_and_data_extraction_ordering_example(self) -> None:
         """Test the ordering example from Ordering and Data Extraction section."""
@@ -291,17 +265,18 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # complex_order = kml.placemarks.children().order_by('visibility', '-name')
         # reversed_order = by_name.reverse()
 
-        by_name = self.kml.placemarks.children().order_by("name")
-        by_name_desc = self.kml.placemarks.children().order_by("-name")
-        complex_order = self.kml.placemarks.children().order_by("visibility", "-name")
+        placemarks = self.kml.placemarks.children()
+        by_name = placemarks.order_by("name")
+        by_name_desc = placemarks.order_by("-name")
+        complex_order = placemarks.order_by("visibility", "-name")
         reversed_order = by_name.reverse()
 
         # Verify ordering works
-        names_asc = [p.name for p in by_name if p.name]
-        names_desc = [p.name for p in by_name_desc if p.name]
+        names_asc = by_name.values_list("name", flat=True)
+        names_desc = by_name_desc.values_list("name", flat=True)
 
         assert names_asc == sorted(names_asc)
-        assert names_desc, sorted(names_asc, reverse=True)
+        assert names_desc == sorted(names_asc, reverse=True)
 
         # Verify complex ordering and reverse
         assert complex_order is not None
@@ -313,19 +288,16 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # names_only = kml.placemarks.children().values('name')
         # name_vis_pairs = kml.placemarks.children().values('name', 'visibility')
 
-        names_only = self.kml.placemarks.children().values("name")
-        name_vis_pairs = self.kml.placemarks.children().values("name", "visibility")
+        placemarks = self.kml.placemarks.children()
+        names_only = placemarks.values("name")
+        name_vis_pairs = placemarks.values("name", "visibility")
 
         # Verify values extraction
         assert isinstance(names_only, list)
         assert isinstance(name_vis_pairs, list)
 
-        if names_only:
-            assert "name" in names_only[0]
-
-        if name_vis_pairs:
-            assert "name" in name_vis_pairs[0]
-            assert "visibility" in name_vis_pairs[0]
+        assert [list(row) for row in names_only] == [["name"]] * 6
+        assert [list(row) for row in name_vis_pairs] == [["name", "visibility"]] * 6
 
     def test_ordering_and_data_extraction_values_list_example(self) -> None:
         """Test the values_list example from Ordering and Data Extraction section."""
@@ -333,8 +305,9 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # name_list = kml.placemarks.children().values_list('name', flat=True)
         # name_vis_tuples = kml.placemarks.children().values_list('name', 'visibility')
 
-        name_list = self.kml.placemarks.children().values_list("name", flat=True)
-        name_vis_tuples = self.kml.placemarks.children().values_list("name", "visibility")
+        placemarks = self.kml.placemarks.children()
+        name_list = placemarks.values_list("name", flat=True)
+        name_vis_tuples = placemarks.values_list("name", "visibility")
 
         # Verify values_list extraction
         assert isinstance(name_list, list)
@@ -375,11 +348,11 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # Verify bounding box query - all our test coordinates are within these bounds
         assert len(bounded_stores) >= 1
         for store in bounded_stores:
-            if store.coordinates:
-                assert store.coordinates.latitude >= 39.0
-                assert store.coordinates.latitude <= 39.5
-                assert store.coordinates.longitude >= -77.0
-                assert store.coordinates.longitude <= -76.0
+            assert store.coordinates is not None
+            assert store.coordinates.latitude >= 39.0
+            assert store.coordinates.latitude <= 39.5
+            assert store.coordinates.longitude >= -77.0
+            assert store.coordinates.longitude <= -76.0
 
     def test_geospatial_queries_coordinate_filters_example(self) -> None:
         """Test the coordinate filters example from Geospatial Queries section."""
@@ -387,8 +360,9 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # has_coords = kml.placemarks.children().has_coordinates()
         # valid_coords = kml.placemarks.children().valid_coordinates()
 
-        has_coords = self.kml.placemarks.children().has_coordinates()
-        valid_coords = self.kml.placemarks.children().valid_coordinates()
+        placemarks = self.kml.placemarks.children()
+        has_coords = placemarks.has_coordinates()
+        valid_coords = placemarks.valid_coordinates()
 
         # Verify coordinate filtering - all our test placemarks have valid coordinates
         assert len(has_coords) == 6  # All placemarks have coordinates
@@ -437,8 +411,8 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         assert results is not None
         for result in results:
             assert result.visibility is True
-            if result.name:
-                assert "store" in result.name.lower()
+            assert result.name is not None
+            assert "store" in result.name.lower()
 
     def test_queryset_chaining_one_chain_example(self) -> None:
         """Test the single chain example from QuerySet Chaining section."""
@@ -461,8 +435,8 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         assert stores is not None
         for store in stores:
             assert store.visibility is True
-            if store.name:
-                assert "store" in store.name.lower()
+            assert store.name is not None
+            assert "store" in store.name.lower()
 
     def test_queryset_properties_state_example(self) -> None:
         """Test the QuerySet properties example from QuerySet Properties section."""
@@ -474,21 +448,11 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
 
         qs = self.kml.placemarks.children().filter(visibility=True).order_by("name")
 
-        # Check QuerySet state
-        is_ordered_msg = f"Is ordered: {qs.is_ordered}"
-        order_fields_msg = f"Order fields: {qs.order_by_fields}"
-        is_distinct_msg = f"Is distinct: {qs.is_distinct}"
-
         # Verify state properties
         assert qs.is_ordered is True
         assert qs.order_by_fields == ["name"]
         assert qs.is_distinct is False
 
-        # Verify message formatting
-        assert is_ordered_msg == "Is ordered: True"
-        assert order_fields_msg == "Order fields: ['name']"
-        assert is_distinct_msg == "Is distinct: False"
-
     def test_queryset_properties_length_existence_example(self) -> None:
         """Test the length and existence example from QuerySet Properties section."""
         # Example from documentation:
@@ -531,9 +495,6 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
 
         # Verify types
         assert isinstance(first_element, type(self.placemark1))
-        # pylint: disable=import-outside-toplevel
-        from kmlorm.core.querysets import KMLQuerySet
-
         assert isinstance(first_five, KMLQuerySet)
 
     def test_advanced_usage_conditional_filtering_example(self) -> None:
@@ -593,9 +554,9 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
 
         # Check that results are within the specified bounds
         for placemark in downtown_area:
-            if placemark.coordinates:
-                assert placemark.coordinates.latitude >= 39.2
-                assert placemark.coordinates.latitude <= 39.3
+            assert placemark.coordinates is not None
+            assert placemark.coordinates.latitude >= 39.2
+            assert placemark.coordinates.latitude <= 39.3
 
     def test_advanced_usage_data_analysis_example(self) -> None:
         """Test the data analysis example from Advanced Usage section."""
@@ -606,19 +567,24 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # total_count = kml.placemarks.children().count()
         # visibility_ratio = visible_count / total_count if total_count > 0 else 0
 
-        all_names = self.kml.placemarks.children().values_list("name", flat=True)
+        placemarks = self.kml.placemarks.children()
+        all_names = placemarks.values_list("name", flat=True)
         unique_names = set(all_names)
-        visible_count = self.kml.placemarks.children().filter(visibility=True).count()
-        total_count = self.kml.placemarks.children().count()
+        visible_count = placemarks.filter(visibility=True).count()
+        total_count = placemarks.count()
         visibility_ratio = visible_count / total_count if total_count > 0 else 0
 
         # Verify data analysis
         assert isinstance(all_names, list)
-        assert isinstance(unique_names, set)
-        assert total_count > 0
-        assert visible_count > 0
-        assert visibility_ratio > 0
-        assert visibility_ratio <= 1
+        assert len(unique_names) == 6
+        assert (visible_count, total_count) == (4, 6)
+        assert visibility_ratio == 4 / 6
+
+        # tally() gives the same counts in one pass over the placemarks
+        assert placemarks.tally(total=None, visible={"visibility": True}) == {
+            "total": total_count,
+            "visible": visible_count,
+        }
 
     def test_performance_lazy_evaluation_example(self) -> None:
         """Test the lazy evaluation example from Performance Considerations section."""
@@ -643,15 +609,14 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # has_stores = kml.placemarks.children().filter(name__icontains='store').exists()
         # has_stores = len(kml.placemarks.children().filter(name__icontains='store')) > 0
 
+        # Build the filtered QuerySet once so both sides compare only the final call
+        stores = self.kml.placemarks.children().filter(name__icontains="store")
+
         # Good - efficient existence check
-        has_stores_efficient = (
-            self.kml.placemarks.children().filter(name__icontains="store").exists()
-        )
+        has_stores_efficient = stores.exists()
 
         # Less efficient - forces full evaluation
-        has_stores_inefficient = (
-            len(list(self.kml.placemarks.children().filter(name__icontains="store"))) > 0
-        )
+        has_stores_inefficient = len(list(stores)) > 0
 
         # Verify both produce same result
         assert has_stores_efficient == has_stores_inefficient
@@ -663,15 +628,14 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # store_count = kml.placemarks.children().filter(name__icontains='store').count()
         # store_count = len(list(kml.placemarks.children().filter(name__icontains='store')))
 
+        # Build the filtered QuerySet once so both sides compare only the final call
+        stores = self.kml.placemarks.children().filter(name__icontains="store")
+
         # Good - efficient counting
-        store_count_efficient = (
-            self.kml.placemarks.children().filter(name__icontains="store").count()
-        )
+        store_count_efficient = stores.count()
 
         # Less efficient - materializes full list
-        store_count_inefficient = len(
-            list(self.kml.placemarks.children().filter(name__icontains="store"))
-        )
+        store_count_inefficient = len(list(stores))
 
         # Verify both produce same result
         assert store_count_efficient == store_count_inefficient
@@ -679,6 +643,7 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
 
     def test_common_patterns_safe_element_retrieval_example(self) -> None:
         """Test the safe element retrieval example from Common Patterns section."""
+
         # Example from documentation:
         # def get_element_safely(qs, **filters):
         #     try:
@@ -686,18 +651,15 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         #     except KMLElementNotFound:
         #         return None
         # headquarters = get_element_safely(kml.placemarks.children(), name='Headquarters')
-        # pylint: disable=import-outside-toplevel
-        from kmlorm.core.querysets import KMLQuerySet as _KMLQuerySet
-        from kmlorm.models.base import KMLElement as _KMLElement
-
-        def get_element_safely(qs: _KMLQuerySet, **filters: Any) -> "Optional[_KMLElement]":
+        def get_element_safely(qs: KMLQuerySet, **filters: Any) -> Optional[KMLElement]:
             try:
-                return cast(_KMLElement, qs.get(**filters))
+                return cast(KMLElement, qs.get(**filters))
             except KMLElementNotFound:
                 return None
 
-        headquarters = get_element_safely(self.kml.placemarks.children(), name="Headquarters")
-        nonexistent = get_element_safely(self.kml.placemarks.children(), name="Nonexistent")
+        placemarks = self.kml.placemarks.children()
+        headquarters = get_element_safely(placemarks, name="Headquarters")
+        nonexistent = get_element_safely(placemarks, name="Nonexistent")
 
         # Verify safe retrieval
         assert headquarters is not None
@@ -710,77 +672,85 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # Note: Current implementation doesn't support nested coordinate filtering
         # Test coordinate validation using available methods
 
-        valid_locations = self.kml.placemarks.children().has_coordinates().valid_coordinates()
+        placemarks = self.kml.placemarks.children()
+        valid_locations = placemarks.has_coordinates().valid_coordinates()
 
-        # Verify coordinate validation methods work
+        # Verify coordinate validation methods work; valid_coordinates() alone
+        # already drops elements without coordinates
         assert len(valid_locations) > 0
+        assert valid_locations.elements == placemarks.valid_coordinates().elements
         for location in valid_locations:
             assert location.coordinates is not None
-            if location.coordinates:
-                # Verify these are valid coordinates within normal ranges
-                assert location.coordinates.latitude >= -90
-                assert location.coordinates.latitude <= 90
-                assert location.coordinates.longitude >= -180
-                assert location.coordinates.longitude <= 180
+            # Verify these are valid coordinates within normal ranges
+            assert location.coordinates.latitude >= -90
+            assert location.coordinates.latitude <= 90
+            assert location.coordinates.longitude >= -180
+            assert location.coordinates.longitude <= 180
 
     def test_common_patterns_geographic_analysis_example(self) -> None:
         """Test the geographic analysis example from Common Patterns section."""
         # Example from documentation:
         # center_lat, center_lon = 39.3, -76.6
         # radius = 10
-        # cluster = kml.placemarks.children().near(center_lon, center_lat, radius_km=radius)
+        # placemarks = kml.placemarks.children()
+        # cluster = placemarks.near(center_lon, center_lat, radius_km=radius)
         # total_in_cluster = cluster.count()
         # visible_in_cluster = cluster.filter(visibility=True).count()
 
         center_lat, center_lon = 39.3, -76.6
         radius = 10
-        cluster = self.kml.placemarks.children().near(center_lon, center_lat, radius_km=radius)
+        placemarks = self.kml.placemarks.children()
+        cluster = placemarks.near(center_lon, center_lat, radius_km=radius)
         total_in_cluster = cluster.count()
         visible_in_cluster = cluster.filter(visibility=True).count()
 
-        analysis_msg = f"Cluster analysis: {visible_in_cluster}/{total_in_cluster} visible"
-
         # Verify geographic analysis
         assert total_in_cluster > 0
         assert visible_in_cluster >= 0
         assert visible_in_cluster <= total_in_cluster
-        assert "Cluster analysis:" in analysis_msg
 
     def test_common_patterns_data_export_example(self) -> None:
         """Test the data export example from Common Patterns section."""
         # Example from documentation:
+        # placemarks = kml.placemarks.children()
         # summary = {
-        #     'total_placemarks': kml.placemarks.children().count(),
-        #     'visible_placemarks': kml.placemarks.children().filter(visibility=True).count(),
-        #     'placemarks_with_coords': kml.placemarks.children().has_coordinates().count(),
-        #     'unique_names': len(set(kml.placemarks.children().values_list('name', flat=True)))
+        #     'total_placemarks': placemarks.count(),
+        #     'visible_placemarks': placemarks.filter(visibility=True).count(),
+        #     'placemarks_with_coords': placemarks.has_coordinates().count(),
+        #     'unique_names': placemarks.distinct_count('name')
         # }
 
+        placemarks = self.kml.placemarks.children()
         summary = {
-            "total_placemarks": self.kml.placemarks.children().count(),
-            "visible_placemarks": self.kml.placemarks.children().filter(visibility=True).count(),
-            "placemarks_with_coords": self.kml.placemarks.children().has_coordinates().count(),
-            "unique_names": len(set(self.kml.placemarks.children().values_list("name", flat=True))),
+            "total_placemarks": placemarks.count(),
+            "visible_placemarks": placemarks.filter(visibility=True).count(),
+            "placemarks_with_coords": placemarks.has_coordinates().count(),
+            "unique_names": placemarks.distinct_count("name"),
         }
 
         # Verify summary generation
         assert summary["total_placemarks"] == 6
         assert summary["visible_placemarks"] > 0
         assert summary["placemarks_with_coords"] == 6
-        assert summary["unique_names"] > 0
+        assert summary["unique_names"] == 6
+        assert placemarks.tally(
+            total=None,
+            visible={"visibility": True},
+            stores={"name__icontains": "store"},
+        ) == {
+            "total": summary["total_placemarks"],
+            "visible": summary["visible_placemarks"],
+            "stores": placemarks.filter(name__icontains="store").count(),
+        }
 
         # Test store data export
-        store_data = (
-            self.kml.placemarks.children()
-            .filter(name__icontains="store")
-            .values("name", "description", "visibility")
+        store_data = placemarks.filter(name__icontains="store").values(
+            "name", "description", "visibility"
         )
 
         assert isinstance(store_data, list)
-        if store_data:
-            assert "name" in store_data[0]
-            assert "description" in store_data[0]
-            assert "visibility" in store_data[0]
+        assert {row["name"] for row in store_data} == {"Store A", "Store B"}
+        assert [list(row) for row in store_data] == [["name", "description", "visibility"]] * 2
 
     def test_error_handling_query_exceptions_example(self) -> None:
         """Test the query exceptions example from Error Handling section."""
@@ -793,12 +763,13 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         #     print("Multiple stores found - query was not specific enough")
 
         # Test KMLElementNotFound
+        placemarks = self.kml.placemarks.children()
         with pytest.raises(KMLElementNotFound):
-            _ = self.kml.placemarks.children().get(name="Nonexistent Store")
+            _ = placemarks.get(name="Nonexistent Store")
 
         # Test successful get
         try:
-            unique_store = self.kml.placemarks.children().get(name="Headquarters")
+            unique_store = placemarks.get(name="Headquarters")
             assert unique_store.name == "Headquarters"
         except KMLElementNotFound:
             pytest.fail("Headquarters should exist")
@@ -811,16 +782,14 @@ class TestQuerySetsDocsExamples:  # pylint: disable=too-many-public-methods
         # Test with the actual exception type
 
         # Test invalid coordinates - the error comes from Coordinate validation, not the near method
-        # pylint: disable=import-outside-toplevel
-        from kmlorm.core.exceptions import KMLValidationError
-
+        placemarks = self.kml.placemarks.children()
         with pytest.raises(KMLValidationError):
             # This will raise during Coordinate creation in the near method
-            _ = self.kml.placemarks.children().near(200, 100, radius_km=10)
+            _ = placemarks.near(200, 100, radius_km=10)
 
         # Test valid coordinates work
         try:
-            nearby = self.kml.placemarks.children().near(-76.6, 39.3, radius_km=10)
+            nearby = placemarks.near(-76.6, 39.3, radius_km=10)
             assert nearby is not None
         except (KMLInvalidCoordinates, KMLValidationError):
             pytest.fail("Valid coordinates should not raise exception")
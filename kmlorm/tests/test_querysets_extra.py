@@ -41,7 +41,12 @@ from types import SimpleNamespace
 from typing import Any, cast
 import pytest
 from kmlorm.core.querysets import KMLQuerySet
-from kmlorm.core.exceptions import KMLQueryError, KMLInvalidCoordinates, KMLElementNotFound
+from kmlorm.core.exceptions import (
+    KMLQueryError,
+    KMLInvalidCoordinates,
+    KMLElementNotFound,
+    KMLValidationError,
+)
 from kmlorm.models.base import KMLElement
 from kmlorm.models.placemark import Placemark
 from kmlorm.models.point import Point, Coordinate
@@ -347,16 +352,35 @@ class TestKMLQuerySetExtra:
         assert isinstance(res, KMLQuerySet)
         assert [cast(int, e.id) for e in res.elements] == [1]
 
+    def test_near_invalid_center_raises_before_reading_elements(self) -> None:
+        """
+        Test that KMLQuerySet.near rejects an out-of-range center with
+        KMLValidationError before any element's coordinates are read, with or
+        without a radius.
+        """
+
+        class _Unreadable(KMLElement):
+            @property
+            def coordinates(self) -> Any:
+                """Fail the test if near() reads the element."""
+                raise AssertionError("element coordinates were read")
+
+        qs: KMLQuerySet = KMLQuerySet([_Unreadable(element_id="x")])
+        for lon, lat in ((200.0, 0.0), (0.0, 100.0), (-180.5, -90.5)):
+            for radius_km in (None, 10.0):
+                with pytest.raises(KMLValidationError):
+                    qs.near(lon, lat, radius_km=radius_km)
+
     def test_within_bounds_invalid_longitude_raises(self) -> None:
         """
-        Test that KMLQuerySet.within_bounds raises an Exception when the 'west' longitude
-        parameter is out of the valid range, even if 'east' is valid. Specifically, this
-        test passes an invalid 'west' value (200) and expects an exception to be raised.
+        Test that KMLQuerySet.within_bounds raises KMLInvalidCoordinates when either the
+        'west' or the 'east' longitude is out of the valid range while the other is valid.
         """
         qs: KMLQuerySet = KMLQuerySet([])
-        # west out of range but east valid should raise per the odd condition in code
-        with pytest.raises(Exception):
+        with pytest.raises(KMLInvalidCoordinates):
             qs.within_bounds(north=10, south=-10, east=0, west=200)
+        with pytest.raises(KMLInvalidCoordinates):
+            qs.within_bounds(north=10, south=-10, east=200, west=0)
 
     def test_has_coordinates_with_coordinates_attrs(self, monkeypatch: Any) -> None:
         """
@@ -668,6 +692,17 @@ class TestKMLQuerySetExtra:
         distinct = qs.distinct()
         assert len(distinct.elements) == 1
 
+    def test_distinct_keeps_first_occurrence_in_order(self) -> None:
+        """
+        Tests that `distinct` keeps the first element seen for each id and
+        preserves the original relative order.
+        """
+        a = Point(element_id="a", name="first")
+        b = Point(element_id="b")
+        a2 = Point(element_id="a", name="second")
+        qs = KMLQuerySet([a, b, a2, b])
+        assert qs.distinct().elements == [a, b]
+
     def test_order_by_multiple_fields_stable(self) -> None:
         """
         Tests that ordering a queryset by multiple fields is stable and correctly breaks ties.
@@ -749,7 +784,7 @@ class TestKMLQuerySetExtra:
                     dict[Any, Any]: A dictionary containing all attribute names and their
                         corresponding values from the instance.
                 """
-                return dict(self.__dict__)
+                return self.__dict__.copy()
 
         wa = WithDict(id=1, name="HelloWorld")
         wb = WithDict(id=2, name="hello")
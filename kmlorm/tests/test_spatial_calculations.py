@@ -337,3 +337,34 @@ class TestSpatialCalculations:
         # Test bearing to list
         bearing = c1.bearing_to([1, 0])
         assert bearing == pytest.approx(90, abs=0.1)
+
+    @pytest.mark.parametrize(
+        "center_lon,center_lat,radius_km",
+        [(-76.6, 39.3, 50.0), (179.9, 10.0, 300.0), (20.0, 85.0, 200.0), (0.0, -60.0, 0.0)],
+    )
+    def test_radius_bounds_enclose_circle(
+        self, center_lon: float, center_lat: float, radius_km: float
+    ) -> None:
+        """Every point within the radius lies inside the bounds from radius_bounds()."""
+        min_lat, max_lat, max_lon_offset = SpatialCalculations.radius_bounds(center_lat, radius_km)
+        center = Coordinate(longitude=center_lon, latitude=center_lat)
+
+        for i in range(-60, 61, 2):
+            for j in range(-60, 61, 2):
+                lat = center_lat + i * 0.05
+                if not -90 <= lat <= 90:
+                    continue
+                lon = (center_lon + j * 0.1 + 180.0) % 360.0 - 180.0
+                distance = SpatialCalculations.distance_between(center, (lon, lat))
+                if distance is None or distance > radius_km:
+                    continue
+                assert min_lat <= lat <= max_lat
+                if max_lon_offset is not None:
+                    assert abs((lon - center_lon + 180.0) % 360.0 - 180.0) <= max_lon_offset
+
+    def test_radius_bounds_unbounded_longitude_near_pole(self) -> None:
+        """A circle reaching a pole has no longitude bound."""
+        min_lat, max_lat, max_lon_offset = SpatialCalculations.radius_bounds(89.5, 100.0)
+        assert max_lon_offset is None
+        assert max_lat == 90.0
+        assert min_lat == pytest.approx(89.5 - 100.0 / 111.195, abs=1e-3)
@@ -0,0 +1,84 @@
+"""
+Tests for the NumPy-backed vectorized spatial calculations.
+
+These tests verify that the vectorized code paths in kmlorm.spatial.vectorized
+agree with the scalar Haversine implementation in SpatialCalculations.
+They are skipped when numpy is not installed.
+"""
+
+from math import isclose
+
+import pytest
+
+from kmlorm.models.placemark import Placemark
+from kmlorm.models.point import Coordinate, Point
+from kmlorm.spatial.calculations import DistanceUnit
+from kmlorm.spatial.exceptions import InvalidCoordinateError
+
+np = pytest.importorskip("numpy")
+
+
+class TestDistanceToArray:
+    """Test distance_to with NumPy array targets."""
+
+    def test_coordinate_distance_to_array_matches_scalar(self) -> None:
+        """Each array result matches the scalar distance_to for the same target."""
+        origin = Coordinate(longitude=-74.006, latitude=40.7128)
+        targets = np.array([[-0.1276, 51.5074], [2.3522, 48.8566], [-74.006, 40.7128]])
+
+        distances = origin.distance_to(targets)
+
+        assert isinstance(distances, np.ndarray)
+        assert distances.shape == (3,)
+        for (lon, lat), distance in zip(targets, distances):
+            expected = origin.distance_to((float(lon), float(lat)))
+            assert expected is not None
+            assert isclose(float(distance), expected, rel_tol=1e-12, abs_tol=1e-9)
+
+    def test_placemark_distance_to_array(self) -> None:
+        """Placemark delegates array targets to the vectorized path."""
+        p1 = Placemark(point=Point(coordinates=(0.0, 0.0)))
+
+        distances = p1.distance_to(np.array([[1.0, 0.0], [0.0, 0.0]]))
+
+        assert distances is not None
+        assert isclose(float(distances[0]), 111.32, rel_tol=0.01)
+        assert float(distances[1]) == 0.0
+
+    def test_array_with_altitude_column_and_units(self) -> None:
+        """(N, 3) arrays are accepted and the unit conversion is applied."""
+        origin = Coordinate(longitude=0.0, latitude=0.0)
+        targets = np.array([[1.0, 0.0, 100.0]])
+
+        km = origin.distance_to(targets)
+        miles = origin.distance_to(targets, unit=DistanceUnit.MILES)
+
+        assert isclose(float(miles[0]), float(km[0]) * DistanceUnit.MILES.value)
+
+    def test_placemark_without_coordinates_returns_none(self) -> None:
+        """A placemark with no coordinates returns None for array targets too."""
+        assert Placemark(name="nowhere").distance_to(np.array([[1.0, 0.0]])) is None
+
+    def test_invalid_array_shape_raises(self) -> None:
+        """Arrays that are not (N, 2) or (N, 3) are rejected."""
+        origin = Coordinate(longitude=0.0, latitude=0.0)
+        with pytest.raises(InvalidCoordinateError):
+            origin.distance_to(np.array([1.0, 0.0]))
+
+    @pytest.mark.parametrize(
+        "row,message",
+        [
+            ([500.0, 0.0], "Invalid longitude: 500.0"),
+            ([-180.5, 0.0], "Invalid longitude: -180.5"),
+            ([0.0, -200.0], "Invalid latitude: -200.0"),
+            ([0.0, float("nan")], "Invalid latitude: nan"),
+        ],
+    )
+    def test_out_of_range_rows_raise(self, row: list, message: str) -> None:
+        """Out-of-range rows are rejected with the message the scalar path gives."""
+        origin = Coordinate(longitude=0.0, latitude=0.0)
+        targets = np.array([[1.0, 1.0], row, [180.0, -90.0]])
+        with pytest.raises(InvalidCoordinateError, match=message):
+            origin.distance_to(targets)
+        with pytest.raises(Exception, match=message):
+            origin.distance_to(tuple(row))
@@ -1148,3 +1148,27 @@ class TestXMLKMLParser:
 
         # Should get the original XMLSyntaxError wrapped in KMLParseError
         assert "Invalid XML syntax" in str(excinfo.value)
+
+    def test_repeated_names_and_style_urls_are_interned(self) -> None:
+        """
+        Test that repeated Placemark names and style URLs share one string object,
+        while descriptions are kept as parsed.
+        """
+        parser = XMLKMLParser()
+        placemark = (
+            "<Placemark><name>Store</name><description>Open late</description>"
+            "<styleUrl>#shop</styleUrl><Point><coordinates>1,2</coordinates></Point>"
+            "</Placemark>"
+        )
+        kml = (
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            f"{placemark * 2}</Document></kml>"
+        )
+
+        _, _, elements = parser.parse_from_string(kml)
+        first, second = elements[0], elements[1]
+
+        assert first.name == "Store"
+        assert first.name is second.name
+        assert first.style_url is second.style_url
+        assert first.description == second.description == "Open late"